@@ -0,0 +1,341 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Runs post processing scripts on GCode files without Cura, using the Script class from Debug.py.
+#
+# Usage:
+#   python Batch.py settings.json part.gcode
+#   python Batch.py settings.toml *.gcode --output processed --workers 8
+#   python Batch.py settings.json part.gcode --layers 500-800
+#   python Batch.py settings.json part_v2.gcode --previous part.gcode part_post.gcode
+#   python Batch.py settings.json part.gcode --estimate
+#
+# The settings file lists the scripts to run in order, with the settings for each. Settings that are left out use their default value.
+#   {"scripts": [
+#       {"script": "AxisToAxis", "settings": {"FROM": "E", "TO": "A1.0 B0.5"}},
+#       {"script": "ExternalExtruder", "settings": {"GCODE_FREQ": "EVERYLINE"}}
+#   ]}
+
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+from itertools import chain
+
+DEBUG_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(os.path.dirname(DEBUG_DIR), "Scripts")
+
+# Cura starts a new layer at each ;LAYER: comment, and keeps the header (;FLAVOR: ...) apart from the start GCode (;Generated with ...)
+LAYER_RE = re.compile(r"^;(?:LAYER:|Generated with )", re.MULTILINE)
+
+def load_settings(path):
+    """Reads a JSON or TOML settings file into a list of (script name, settings dictionary)."""
+    if path.lower().endswith(".toml"):
+        import tomllib # Python 3.11+
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    if isinstance(config, dict):
+        config = config["scripts"]
+    return [(entry["script"], dict(entry.get("settings", {}))) for entry in config]
+
+def load_scripts(config, scripts_dir=SCRIPTS_DIR):
+    """Creates an instance of each script in config (from load_settings) with its settings applied."""
+    for path in (DEBUG_DIR, scripts_dir):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    scripts = []
+    for name, settings in config:
+        script = getattr(importlib.import_module(name), name)()
+        script.KeyValue = settings
+        scripts.append(script)
+    return scripts
+
+def split_layers(gcode):
+    """Splits the text of a GCode file into the list of layers Cura passes to scripts."""
+    starts = [m.start() for m in LAYER_RE.finditer(gcode) if m.start() > 0]
+    return [gcode[a:b] for a, b in zip([0] + starts, starts + [len(gcode)])]
+
+def parse_layers(text):
+    """Reads a layer range such as "500-800", "500-" (to the end) or "500" into (first, last), where last is None for the end."""
+    first, sep, last = text.partition("-")
+    try:
+        return int(first), (int(last) if last else None) if sep else int(first)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid layer range: {text}")
+
+def read_range(path, start, end):
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start).decode("utf-8", "surrogateescape")
+
+def entry_state(scripts, i, index, input_path, start):
+    """Returns the state script i starts from at byte start of input_path, for scripts with getLayerStates.
+    The first script's states at each layer are kept in the file's index, so the file only has to be scanned once for them, a layer at a time.
+    The other scripts see the GCode as the scripts before them output it, so the part before start is run through those first.
+    """
+    from GCodeIndex import index_path
+    from GCodeTokenizer import split_lines
+    script = scripts[i]
+    offsets = index.layer_offsets()
+    if i == 0:
+        key = script.getStateKey()
+        if key not in index.states:
+            states = []
+            state = script.getLayerStates([])[0]
+            with open(input_path, "rb") as f:
+                # the part before the first layer, then each layer
+                for a, b in zip([0] + offsets, offsets):
+                    state = script.getLayerStates([f.read(b - a).decode("utf-8", "surrogateescape")], state)[-1]
+                    states.append(state)
+            index.states[key] = states
+            index.write(index_path(input_path))
+        return index.states[key][offsets.index(start)]
+
+    lines = read_range(input_path, 0, start).splitlines(keepends=True)
+    for before, transform, after in (script.getLineTransform() for script in scripts[:i]):
+        lines = chain(before, transform(split_lines(lines)))
+    return script.getLayerStates(["".join(lines)])[-1]
+
+def process_range(scripts, input_path, output_path, first, last=None):
+    """Runs the line transforms of scripts (see getLineTransform) on layers first to last of input_path only, and writes just those layers to output_path.
+    The output is the same as those layers of the whole file processed, so a failed run can be finished from a layer on and the parts joined.
+    A range from the first layer also has the part of the file before it, and one to the last layer the end GCode, each with what the scripts add before or after the GCode.
+    The layers are found with the file's index (see GCodeIndex.py), which is made and written next to the file the first time.
+    """
+    from GCodeIndex import load_index
+    from GCodeTokenizer import split_lines
+    index = load_index(input_path)
+    start, end = index.layer_range(first, last)
+    if start == index.layer_offsets()[0]:
+        start = 0
+    lines = read_range(input_path, start, end).splitlines(keepends=True)
+    for i, script in enumerate(scripts):
+        if hasattr(script, "getLayerStates"):
+            state = entry_state(scripts, i, index, input_path, start) if start else script.getLayerStates([])[0]
+            before, transform, after = script.getLineTransform(state)
+        else:
+            before, transform, after = script.getLineTransform()
+        lines = transform(split_lines(lines))
+        if start == 0:
+            lines = chain(before, lines)
+        if end == index.size:
+            lines = chain(lines, after)
+    with open(output_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        f.writelines(lines)
+    return output_path
+
+def read_layers(path):
+    with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        return split_layers(f.read())
+
+def matching_layers(old, new):
+    """Returns a list with, for each layer in new, the index of the same layer in old or None.
+    Layers are compared by their hashes, so the diff stays cheap, and each match is then checked in full.
+    """
+    matches = [None] * len(new)
+    matcher = SequenceMatcher(None, [hash(layer) for layer in old], [hash(layer) for layer in new], autojunk=False)
+    for j, i, size in matcher.get_matching_blocks():
+        for k in range(size):
+            if old[j + k] == new[i + k]:
+                matches[i + k] = j + k
+    return matches
+
+def process_incremental(scripts, previous_input, previous_output, input_path, output_path):
+    """Same as process_file, given the output of the same scripts and settings for an earlier version of input_path, e.g. before a small change was re-sliced.
+    Only the layers that changed are processed, along with the layers after them whose state at the start has changed (for scripts with getLayerStates).
+    The other layers are copied from previous_output. Layers are run through the scripts' line transforms as in GCodePipeline.py.
+    """
+    from GCodePipeline import run_pipeline
+    old = read_layers(previous_input)
+    old_output = read_layers(previous_output)
+    data = read_layers(input_path)
+    if len(old_output) != len(old): # not the output of previous_input
+        old = []
+    matches = matching_layers(old, data)
+
+    # state at the start of each previous layer (and after the last) of the scripts that carry state, which see the output of the scripts before them
+    stateful = [k for k, script in enumerate(scripts) if hasattr(script, "getLayerStates")]
+    old_states = {}
+    if any(match is not None for match in matches):
+        for k in stateful:
+            old_states[k] = scripts[k].getLayerStates(run_pipeline(scripts[:k], list(old)) if k else old)
+
+    states = {k: scripts[k].getLayerStates([])[0] for k in stateful}
+    last = len(data) - 1
+    processed = 0
+    for i, layer in enumerate(data):
+        j = matches[i]
+        if j is not None and (i == 0) == (j == 0) and (i == last) == (j == len(old) - 1) and all(states[k] == old_states[k][j] for k in stateful):
+            data[i] = old_output[j]
+            states = {k: old_states[k][j + 1] for k in stateful}
+            continue
+
+        processed += 1
+        for k, script in enumerate(scripts):
+            if k in stateful:
+                before, transform, after = script.getLineTransform(states[k])
+                states[k] = script.getLayerStates([layer], states[k])[-1]
+            else:
+                before, transform, after = script.getLineTransform()
+            lines = transform(layer.splitlines(keepends=True))
+            if i == 0:
+                lines = chain(before, lines)
+            if i == last:
+                lines = chain(lines, after)
+            layer = "".join(lines)
+        data[i] = layer
+
+    with open(output_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        f.writelines(data)
+    print(f"  Processed {processed} of {len(data)} layers, the rest were copied from {previous_output}")
+    return output_path
+
+class PrintTime:
+    """Passes GCode through unchanged, as a script run after the others, and estimates how long it takes to run a layer at a time (see MoveTime.py)."""
+
+    def __init__(self):
+        from MoveTime import START_STATE
+        self.state = START_STATE
+        self.seconds = 0.0
+
+    def add(self, layer):
+        from MoveTime import estimate
+        times, self.state = estimate(layer, self.state)
+        if len(times):
+            self.seconds += float(times[-1])
+
+    def execute(self, data):
+        for layer in data:
+            self.add(layer)
+        return data
+
+    def executeStream(self, lines):
+        layer = []
+        for line in lines:
+            if line.startswith(";LAYER:") and layer:
+                self.add("".join(layer))
+                layer = []
+            layer.append(line)
+            yield line
+        if layer:
+            self.add("".join(layer))
+
+    def getLineTransform(self):
+        return [], self.executeStream, []
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} h {minutes:02} min {seconds:02} s"
+
+def process_file(scripts, input_path, output_path, stream=False, fused=False, mapped=False, layers=None, estimate=False):
+    """Runs scripts in order on input_path and writes the result to output_path.
+    With stream, lines are passed through each script's executeStream instead, keeping memory use bounded.
+    With fused, all scripts are run one layer at a time (see GCodePipeline.py).
+    With mapped, the file is memory mapped and only the lines the scripts act on are decoded and passed to them (see GCodeStream.map_file).
+    With layers (first, last), only those layers are processed and written (see process_range).
+    With estimate, the time the output takes to run is estimated as it is written and printed.
+    """
+    if estimate:
+        timer = PrintTime()
+        process_file(list(scripts) + [timer], input_path, output_path, stream, fused, mapped, layers)
+        print(f"  Estimated print time of {output_path}: {format_seconds(timer.seconds)}")
+        return output_path
+    if layers is not None:
+        return process_range(scripts, input_path, output_path, *layers)
+    if mapped:
+        from GCodeStream import map_file
+        map_file(scripts, input_path, output_path)
+        return output_path
+    if stream:
+        from GCodeStream import stream_file
+        stream_file(scripts, input_path, output_path)
+        return output_path
+
+    with open(input_path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        data = split_layers(f.read())
+    if fused:
+        from GCodePipeline import run_pipeline
+        data = run_pipeline(scripts, data)
+    else:
+        for script in scripts:
+            data = script.execute(data)
+    with open(output_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        f.writelines(data)
+    return output_path
+
+# Scripts of each worker process, created once and reused for every file the worker is given
+worker_scripts = []
+
+def init_worker(config, scripts_dir):
+    worker_scripts[:] = load_scripts(config, scripts_dir)
+
+def run_worker(input_path, output_path, stream, fused, mapped, layers, estimate):
+    return process_file(worker_scripts, input_path, output_path, stream, fused, mapped, layers, estimate)
+
+def output_path(input_path, output, many):
+    if output is None:
+        base, ext = os.path.splitext(input_path)
+        return base + "_post" + (ext or ".gcode")
+    if many or os.path.isdir(output):
+        os.makedirs(output, exist_ok=True)
+        return os.path.join(output, os.path.basename(input_path))
+    return output
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run Cura post processing scripts on GCode files.")
+    parser.add_argument("settings", help="JSON or TOML file listing the scripts to run and their settings")
+    parser.add_argument("inputs", nargs="+", help="GCode files to process")
+    parser.add_argument("-o", "--output", help="output file, or folder when processing several files (default: <input>_post.gcode)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="number of files to process at once (0 uses one per CPU)")
+    parser.add_argument("--scripts", default=SCRIPTS_DIR, help="folder containing the scripts")
+    parser.add_argument("--stream", action="store_true", help="process files line by line to keep memory use bounded")
+    parser.add_argument("--fused", action="store_true", help="run all scripts one layer at a time, each layer through every script before the next")
+    parser.add_argument("--mmap", action="store_true", help="memory map files and only decode the lines the scripts act on, the rest is copied as it is")
+    parser.add_argument("--previous", nargs=2, metavar=("INPUT", "OUTPUT"), help="an earlier version of the input and its output with the same settings, only the layers that changed are processed")
+    parser.add_argument("--layers", type=parse_layers, help="only process and write layers FIRST-LAST (e.g. 500-800, or 500- to the end), found with an index kept next to each file")
+    parser.add_argument("--estimate", action="store_true", help="print an estimate of how long each output takes to run, worked out as it is written (with --mmap every line is then decoded)")
+    args = parser.parse_args(argv)
+    if args.estimate:
+        if args.scripts not in sys.path:
+            sys.path.insert(0, args.scripts)
+        from MoveTime import available
+        if not available():
+            parser.error("--estimate needs NumPy")
+
+    config = load_settings(args.settings)
+    many = len(args.inputs) > 1
+    if args.previous:
+        if many:
+            parser.error("--previous takes a single input file")
+        if args.estimate:
+            parser.error("--estimate can't be used with --previous, as the layers copied from the earlier output aren't read")
+        path = output_path(args.inputs[0], args.output, False)
+        print("  Writing GCode to " + process_incremental(load_scripts(config, args.scripts), *args.previous, args.inputs[0], path))
+        return 0
+    jobs = [(path, output_path(path, args.output, many), args.stream, args.fused, args.mmap, args.layers, args.estimate) for path in args.inputs]
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    if workers == 1 or not many:
+        scripts = load_scripts(config, args.scripts)
+        for job in jobs:
+            print("  Writing GCode to " + process_file(scripts, *job))
+        for script in scripts:
+            if getattr(script, "cache", None):
+                print(f"  {type(script).__name__} layer cache: {script.cache.hits} hits, {script.cache.misses} misses")
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=init_worker, initargs=(config, args.scripts)) as pool:
+            for path in pool.map(run_worker, *zip(*jobs)):
+                print("  Writing GCode to " + path)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
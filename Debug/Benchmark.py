@@ -0,0 +1,119 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Times scripts on generated GCode (see Synthetic.py) from small files up to production sizes.
+# Each measurement runs in its own process so that peak memory use (RSS) is measured per run.
+#
+# Usage:
+#   python Benchmark.py --sizes 1 10 100 --output results.json
+#   python Benchmark.py --sizes 2048 --scripts ExternalExtruder --modes stream --relative
+#
+# Results are written as JSON with lines/s, MB/s and peak RSS for each script, mode and size.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import Batch
+import Synthetic
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024 # bytes on macOS, KB elsewhere
+
+def measure(script_name, mode, path, settings):
+    """Runs one script on path in this process and returns (seconds, peak RSS in MB).
+    execute mode times script.execute on the file split into layers, stream mode times executeStream from file to file.
+    """
+    script = Batch.load_scripts([(script_name, settings)])[0]
+    if mode == "stream":
+        from GCodeStream import stream_file
+        start = time.perf_counter()
+        stream_file([script], path, os.devnull)
+    else:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            data = Batch.split_layers(f.read())
+        start = time.perf_counter()
+        script.execute(data)
+    return time.perf_counter() - start, peak_rss_mb()
+
+def generate(workdir, size_mb, options):
+    """Generates (or reuses) a file of about size_mb for options. Returns (path, bytes, lines)."""
+    name = "synthetic_{}MB_{}.gcode".format(size_mb, "_".join(f"{k}{v}" for k, v in sorted(options.items())))
+    path = os.path.join(workdir, name)
+    if os.path.exists(path + ".json"):
+        with open(path + ".json") as f:
+            size, count = json.load(f)
+    else:
+        print(f"  Generating {size_mb} MB file...")
+        size, count = Synthetic.write_file(path, size_mb, **options)
+        with open(path + ".json", "w") as f:
+            json.dump([size, count], f)
+    return path, size, count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark post processing scripts on generated GCode.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 8, 64, 512, 2048], help="file sizes in MB")
+    parser.add_argument("--scripts", nargs="+", default=["AxisToAxis", "ExternalExtruder"])
+    parser.add_argument("--modes", nargs="+", default=["execute", "stream"], choices=["execute", "stream"])
+    parser.add_argument("--settings", help="JSON or TOML settings file (as for Batch.py) for the scripts, otherwise defaults are used")
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "gcode_benchmark"), help="folder for generated files (reused between runs)")
+    parser.add_argument("--output", help="file to write the JSON results to (default: print them)")
+    parser.add_argument("--measure", nargs=3, metavar=("SCRIPT", "MODE", "FILE"), help=argparse.SUPPRESS)
+    Synthetic.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    settings = {}
+    if args.settings:
+        settings = dict(Batch.load_settings(args.settings))
+
+    if args.measure:
+        script_name, mode, path = args.measure
+        seconds, rss = measure(script_name, mode, path, settings.get(script_name, {}))
+        print(json.dumps({"seconds": seconds, "peak_rss_mb": rss}))
+        return 0
+
+    options = Synthetic.generator_options(args)
+    os.makedirs(args.workdir, exist_ok=True)
+    results = []
+    for size_mb in args.sizes:
+        path, size, count = generate(args.workdir, size_mb, options)
+        for script_name in args.scripts:
+            for mode in args.modes:
+                command = [sys.executable, os.path.abspath(__file__), "--measure", script_name, mode, path]
+                if args.settings:
+                    command += ["--settings", args.settings]
+                run = json.loads(subprocess.run(command, check=True, capture_output=True, text=True).stdout.splitlines()[-1])
+                seconds = run["seconds"]
+                results.append({
+                    "script": script_name,
+                    "mode": mode,
+                    "size_mb": size / 1e6,
+                    "lines": count,
+                    "seconds": seconds,
+                    "lines_per_s": count / seconds,
+                    "mb_per_s": size / 1e6 / seconds,
+                    "peak_rss_mb": run["peak_rss_mb"]
+                })
+                print(f"  {script_name} {mode} {size / 1e6:.1f} MB: {seconds:.2f} s, {count / seconds:.0f} lines/s, {size / 1e6 / seconds:.2f} MB/s")
+
+    report = json.dumps({"generator": options, "results": results}, indent=4)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    else:
+        print(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
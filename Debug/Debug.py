@@ -1,3 +1,5 @@
+import json
+
 from Data import gcode
 
 class Script:
@@ -7,7 +9,10 @@ class Script:
         self.KeyValue = {}
 
     def getSettingValueByKey(self,s):
-        return self.KeyValue[s]
+        if s in self.KeyValue:
+            return self.KeyValue[s]
+        # Cura falls back to the default value of settings that haven't been changed
+        return json.loads(self.getSettingDataString())["settings"][s]["default_value"]
 
     def execute(self, d):
         return d
@@ -0,0 +1,214 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Replays a GCode file against a model of a printer's firmware, to find out whether the GCode can be sent and planned as fast as the moves run.
+# The host sends each line over a serial link (10 bits a byte) as soon as the firmware has room for it in its command queue. The firmware parses
+# each command, then adds each move to its planner buffer once a block is free, and the moves are run in order, each taking the time MoveTime.py
+# estimates for it. Whenever the planner runs out of blocks before the next one is added, the printer stands still: an underrun.
+# Arcs are split into blocks of --arc-segment mm, as Marlin does. G4, G28, M400 and the heating waits wait for the moves before them to finish.
+# Comments and blank lines aren't sent, as most hosts strip them.
+#
+# Usage:
+#   python Firmware.py part_post.gcode
+#   python Firmware.py part_post.gcode --baud 115200 --buffer 16 --parse-ms 1.0 --output report.json
+
+import argparse
+import heapq
+import json
+import math
+import os
+import sys
+from collections import deque
+
+DEBUG_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(os.path.dirname(DEBUG_DIR), "Scripts")
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
+
+import Batch
+import MoveTable
+from MoveTime import START_STATE, estimate, available
+
+SYNC = frozenset(["G4", "G28", "G29", "M109", "M190", "M400"]) # commands that wait for the moves before them to finish
+
+class Firmware:
+    """Model of a printer's firmware being sent GCode. Pass the GCode to add a layer at a time, in order, then read the results with report."""
+
+    def __init__(self, baud=250000, buffer=16, queue=4, parse=0.0005, plan=0.0, arc_segment=1.0, comments=False, checksums=False, top=10):
+        """baud: serial link speed, buffer: planner blocks, queue: commands the firmware holds before parsing them,
+        parse: seconds to parse a command, plan: seconds to plan each block, arc_segment: length (mm) of the blocks an arc is split into (0 for one block),
+        comments: send comments too, checksums: send a line number and checksum with each line, top: number of worst underruns and layers kept.
+        """
+        self.baud = baud
+        self.parse = parse
+        self.plan = plan
+        self.arc_segment = arc_segment
+        self.comments = comments
+        self.checksums = checksums
+        self.top = top
+        self.blocks = deque(maxlen=buffer) # end times of the last blocks added to the planner, the oldest is freed first
+        self.queue = deque(maxlen=queue) # times the last commands were taken from the command queue
+        self.link = 0.0 # time the serial link is free
+        self.parser = 0.0 # time the parser is free
+        self.motion = 0.0 # time the planner runs out of blocks
+        self.waited = True # the planner was emptied on purpose (at the start and by SYNC commands), so the next block isn't an underrun
+        self.state = START_STATE
+        self.layer = None
+        self.line = 0
+        self.commands = 0
+        self.sent = 0 # bytes
+        self.busy = 0.0 # seconds the serial link was sending
+        self.block_count = 0
+        self.estimated = 0.0 # seconds the moves take if the planner never runs out
+        self.distance = 0.0 # mm of moves
+        self.underruns = 0
+        self.idle = 0.0 # seconds stood still by underruns
+        self.worst = [] # heap of the top (seconds idle, line, layer)
+        self.layers = {} # layer: [underruns, seconds idle]
+
+    def add(self, text):
+        """Sends the lines of text (one or more layers of GCode) to the firmware."""
+        table = MoveTable.parse(text, "XYZEFIJPS")
+        times, self.state, distances = estimate(text, self.state, table, True)
+        durations = MoveTable.np.diff(times, prepend=0.0).tolist()
+        distances = distances.tolist()
+        commands = table["command"].tolist()
+        starts = table["start"].tolist()
+        ends = (table["end"] if self.comments else table["comment"]).tolist()
+        for i in range(len(table)):
+            self.line += 1
+            if text.startswith(";LAYER:", starts[i]):
+                self.layer = text[starts[i] + 7:table["end"][i]].strip()
+            code = text[starts[i]:ends[i]].strip()
+            if code:
+                self.send(code, commands[i], durations[i], distances[i])
+
+    def send(self, code, command, duration, distance):
+        """Sends one line with code (and no line ending), whose moves take duration seconds over distance mm."""
+        self.commands += 1
+        size = len(code) + 1
+        if self.checksums:
+            numbered = "N{} {}".format(self.commands, code)
+            checksum = 0
+            for byte in numbered.encode("latin-1", "replace"):
+                checksum ^= byte
+            size = len(numbered) + len(str(checksum)) + 2
+        self.sent += size
+
+        # the line is sent once the line before it has been and the firmware has room for it
+        transmit = size * 10 / self.baud
+        start = self.link
+        if len(self.queue) == self.queue.maxlen:
+            start = max(start, self.queue[0])
+        self.link = start + transmit
+        self.busy += transmit
+        done = max(self.link, self.parser) + self.parse
+
+        if command in SYNC:
+            done = max(done, self.motion) + (duration if command == "G4" else 0.0)
+            self.motion = done
+            self.waited = True
+        elif duration > 0:
+            pieces = 1
+            if command in ("G2", "G3") and self.arc_segment > 0:
+                pieces = max(1, math.ceil(distance / self.arc_segment))
+            for piece in range(pieces):
+                if len(self.blocks) == self.blocks.maxlen:
+                    done = max(done, self.blocks[0]) # wait for a free block
+                done += self.plan
+                if done > self.motion and not self.waited:
+                    self.underrun(done - self.motion)
+                self.motion = max(done, self.motion) + duration / pieces
+                self.blocks.append(self.motion)
+                self.waited = False
+            self.block_count += pieces
+            self.estimated += duration
+            self.distance += distance
+        self.parser = done
+        self.queue.append(done)
+
+    def underrun(self, seconds):
+        self.underruns += 1
+        self.idle += seconds
+        entry = (seconds, self.line, self.layer)
+        if len(self.worst) < self.top:
+            heapq.heappush(self.worst, entry)
+        elif entry > self.worst[0]:
+            heapq.heapreplace(self.worst, entry)
+        totals = self.layers.setdefault(self.layer, [0, 0.0])
+        totals[0] += 1
+        totals[1] += seconds
+
+    def report(self):
+        """Returns the results as a dictionary."""
+        seconds = max(self.motion, self.parser)
+        layers = sorted(self.layers.items(), key=lambda item: -item[1][1])[:self.top]
+        return {
+            "lines": self.line,
+            "commands": self.commands,
+            "bytes": self.sent,
+            "blocks": self.block_count,
+            "seconds": seconds,
+            "estimated_seconds": self.estimated,
+            "link_busy": self.busy / seconds if seconds else 0.0,
+            "speed": self.distance / seconds if seconds else 0.0,
+            "estimated_speed": self.distance / self.estimated if self.estimated else 0.0,
+            "underruns": self.underruns,
+            "idle_seconds": self.idle,
+            "worst_underruns": [{"line": line, "layer": layer, "seconds": idle} for idle, line, layer in sorted(self.worst, reverse=True)],
+            "worst_layers": [{"layer": layer, "underruns": count, "seconds": idle} for layer, (count, idle) in layers]
+        }
+
+def simulate(path, firmware):
+    """Sends the GCode file at path to firmware a layer at a time, and returns its report."""
+    with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        layer = []
+        for line in f:
+            if line.startswith(";LAYER:") and layer:
+                firmware.add("".join(layer))
+                layer = []
+            layer.append(line)
+        if layer:
+            firmware.add("".join(layer))
+    return firmware.report()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a GCode file against a model of a printer's firmware and report planner underruns.")
+    parser.add_argument("input", help="GCode file, e.g. the output of Batch.py")
+    parser.add_argument("--baud", type=int, default=250000, help="serial link speed (default: 250000)")
+    parser.add_argument("--buffer", type=int, default=16, help="planner buffer size in blocks (default: 16, Marlin's BLOCK_BUFFER_SIZE)")
+    parser.add_argument("--queue", type=int, default=4, help="commands the firmware holds before parsing them (default: 4, Marlin's BUFSIZE)")
+    parser.add_argument("--parse-ms", type=float, default=0.5, help="time to parse a command in ms (default: 0.5)")
+    parser.add_argument("--plan-ms", type=float, default=0.0, help="time to plan each block in ms (default: 0)")
+    parser.add_argument("--arc-segment", type=float, default=1.0, help="length in mm of the blocks arcs are split into, 0 for one block per arc (default: 1, Marlin's MM_PER_ARC_SEGMENT)")
+    parser.add_argument("--comments", action="store_true", help="send comments too")
+    parser.add_argument("--checksums", action="store_true", help="send a line number and checksum with each line")
+    parser.add_argument("--top", type=int, default=10, help="number of worst underruns and layers to list (default: 10)")
+    parser.add_argument("--output", help="file to also write the JSON results to")
+    args = parser.parse_args(argv)
+    if not available():
+        parser.error("NumPy is needed to work out how long the moves take")
+
+    firmware = Firmware(args.baud, args.buffer, args.queue, args.parse_ms / 1000, args.plan_ms / 1000, args.arc_segment, args.comments, args.checksums, args.top)
+    results = simulate(args.input, firmware)
+    results["settings"] = {key: getattr(args, key) for key in ("baud", "buffer", "queue", "parse_ms", "plan_ms", "arc_segment", "comments", "checksums")}
+
+    seconds = results["seconds"]
+    estimated = results["estimated_seconds"]
+    print(f"  {args.input}: {results['commands']} commands ({results['bytes'] / 1e6:.2f} MB) at {args.baud} baud, serial link busy {results['link_busy']:.0%} of the time")
+    print(f"  Print time: {Batch.format_seconds(seconds)}, {Batch.format_seconds(estimated)} if the planner never ran out ({seconds / estimated - 1 if estimated else 0.0:+.1%})")
+    print(f"  Effective speed: {results['speed']:.1f} mm/s, {results['estimated_speed']:.1f} mm/s if the planner never ran out")
+    print(f"  Underruns: {results['underruns']}, standing still for {results['idle_seconds']:.1f} s")
+    for entry in results["worst_underruns"]:
+        print(f"    line {entry['line']} (layer {entry['layer']}): {entry['seconds'] * 1000:.1f} ms")
+    if results["worst_layers"]:
+        print("  Layers with the most time standing still:")
+        for entry in results["worst_layers"]:
+            print(f"    layer {entry['layer']}: {entry['underruns']} underruns, {entry['seconds']:.2f} s")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
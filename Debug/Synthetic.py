@@ -0,0 +1,170 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Generates Cura-like GCode of any size for benchmarking scripts (see Benchmark.py).
+# The same options and seed always produce the same file.
+#
+# Usage:
+#   python Synthetic.py out.gcode --size 100 --relative --arcs 0.2
+
+import argparse
+import math
+import random
+
+TYPES = ["WALL-OUTER", "WALL-INNER", "SKIN", "FILL"]
+
+def num(value, places=3):
+    """Formats a number the way Cura does (no trailing zeros)."""
+    text = f"{value:.{places}f}".rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
+
+def generate(layers=100, segments=500, retract_every=40, relative=False, arcs=0.05, support=0.0, seed=0):
+    """Yields the lines of a GCode file.
+    layers: number of layers
+    segments: extruding moves per layer, shared between the ;TYPE: sections of the layer
+    retract_every: average number of moves between travel moves with a retraction (0 for none)
+    relative: relative extrusion (M83) instead of absolute (M82)
+    arcs: fraction of extruding moves that are G2/G3 arcs
+    support: fraction of layers with a ;TYPE:SUPPORT section
+    """
+    rng = random.Random(seed)
+    layer_height = 0.2
+    retract = 1.0
+    t = 0.0
+
+    yield ";FLAVOR:Marlin\n"
+    yield f";TIME:{int(layers * segments * 0.05)}\n"
+    yield ";Layer height: 0.2\n"
+    yield ";Generated with Cura_SteamEngine 5.2.1\n"
+    yield "M140 S60\nM105\nM190 S60\nM104 S210\nM105\nM109 S210\n"
+    yield ("M83" if relative else "M82") + " ;" + ("relative" if relative else "absolute") + " extrusion mode\n"
+    yield "G28 ;Home\nG92 E0 ;Reset Extruder\nG1 Z2.0 F3000 ;Move Z Axis up\n"
+    yield "G1 X10.1 Y20 Z0.28 F5000.0 ;Move to start position\n"
+    yield "G1 X10.1 Y200.0 Z0.28 F1500.0 E15 ;Draw the first line\n"
+    yield "G92 E0 ;Reset Extruder\n"
+    yield "G1 F1800 E-1\n"
+    E = -retract
+    yield f";LAYER_COUNT:{layers}\n"
+
+    x, y = 200.0, 200.0
+    for layer in range(layers):
+        z = layer_height * (layer + 1)
+        yield f";LAYER:{layer}\n"
+        if layer == 0:
+            yield "M107\n"
+        elif layer == 1:
+            yield "M106 S255\n"
+
+        types = (["SKIRT"] if layer == 0 else []) + TYPES + (["SUPPORT"] if rng.random() < support else [])
+        per_type = max(1, segments // len(types))
+
+        x, y = 200.0 + rng.uniform(-40, 40), 200.0 + rng.uniform(-40, 40)
+        yield f"G0 F6000 X{num(x)} Y{num(y)} Z{num(z)}\n"
+        # unretract at the start of each layer
+        if relative:
+            yield f"G1 F1800 E{num(retract, 5)}\n"
+        else:
+            E += retract
+            yield f"G1 F1800 E{num(E, 5)}\n"
+
+        for type_name in types:
+            yield f";TYPE:{type_name}\n"
+            heading = rng.uniform(0, 2 * math.pi)
+            feed = True
+            for i in range(per_type):
+                if retract_every and rng.random() < 1.0 / retract_every:
+                    # travel with retraction
+                    if relative:
+                        yield f"G1 F1800 E-{num(retract, 5)}\n"
+                    else:
+                        E -= retract
+                        yield f"G1 F1800 E{num(E, 5)}\n"
+                    x, y = 200.0 + rng.uniform(-40, 40), 200.0 + rng.uniform(-40, 40)
+                    yield f"G0 F9000 X{num(x)} Y{num(y)}\n"
+                    if relative:
+                        yield f"G1 F1800 E{num(retract, 5)}\n"
+                    else:
+                        E += retract
+                        yield f"G1 F1800 E{num(E, 5)}\n"
+                    feed = True
+
+                heading += rng.gauss(0, 0.3)
+                length = rng.uniform(0.2, 8.0)
+                nx = min(max(x + length * math.cos(heading), 100.0), 300.0)
+                ny = min(max(y + length * math.sin(heading), 100.0), 300.0)
+                dE = 0.033 * math.hypot(nx - x, ny - y)
+                if relative:
+                    e_text = num(dE, 5)
+                else:
+                    E += dE
+                    e_text = num(E, 5)
+                f_text = f"F{rng.choice((1200, 1500, 2400))} " if feed else ""
+                feed = False
+
+                if rng.random() < arcs:
+                    # arc through the same end point, centre to one side of the chord
+                    code = "G2" if rng.random() < 0.5 else "G3"
+                    i_off = (ny - y) / 2 + rng.uniform(-1, 1)
+                    j_off = -(nx - x) / 2 + rng.uniform(-1, 1)
+                    yield f"{code} {f_text}X{num(nx)} Y{num(ny)} I{num(i_off)} J{num(j_off)} E{e_text}\n"
+                else:
+                    yield f"G1 {f_text}X{num(nx)} Y{num(ny)} E{e_text}\n"
+                x, y = nx, ny
+                t += length / 25.0
+
+        yield f";TIME_ELAPSED:{t:.6f}\n"
+
+    yield "M140 S0\nM107\nG91 ;Relative positioning\nG1 E-2 F2700 ;Retract a bit\nG1 E-2 Z0.2 F2400 ;Retract and raise Z\n"
+    yield "G90 ;Absolute positioning\nM106 S0 ;Turn-off fan\nM104 S0 ;Turn-off hotend\nM140 S0 ;Turn-off bed\n"
+    yield "M84 X Y E ;Disable all steppers but Z\n"
+    yield ("M83" if relative else "M82") + " ;" + ("relative" if relative else "absolute") + " extrusion mode\n"
+    yield "M104 S0\n;End of Gcode\n"
+
+def layers_for_size(size_mb, **options):
+    """Estimates the number of layers needed for a file of about size_mb megabytes."""
+    sample = dict(options, layers=4)
+    sample_bytes = sum(len(line) for line in generate(**sample))
+    per_layer = sum(len(line) for line in generate(**dict(sample, layers=8))) - sample_bytes
+    return max(1, round((size_mb * 1e6 - sample_bytes) / (per_layer / 4) + 4))
+
+def write_file(path, size_mb=None, **options):
+    """Writes a generated file to path, sized to about size_mb megabytes if given. Returns (bytes, lines)."""
+    if size_mb is not None:
+        options["layers"] = layers_for_size(size_mb, **options)
+    size = 0
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for line in generate(**options):
+            f.write(line)
+            size += len(line)
+            count += line.count("\n")
+    return size, count
+
+def add_arguments(parser):
+    parser.add_argument("--segments", type=int, default=500, help="extruding moves per layer")
+    parser.add_argument("--retract-every", type=int, default=40, help="average moves between retractions (0 for none)")
+    parser.add_argument("--relative", action="store_true", help="relative extrusion (M83) instead of absolute (M82)")
+    parser.add_argument("--arcs", type=float, default=0.05, help="fraction of moves that are G2/G3 arcs")
+    parser.add_argument("--support", type=float, default=0.0, help="fraction of layers with support")
+    parser.add_argument("--seed", type=int, default=0)
+
+def generator_options(args):
+    return {
+        "segments": args.segments,
+        "retract_every": args.retract_every,
+        "relative": args.relative,
+        "arcs": args.arcs,
+        "support": args.support,
+        "seed": args.seed
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate Cura-like GCode for benchmarking.")
+    parser.add_argument("output")
+    parser.add_argument("--size", type=float, help="approximate file size in MB (overrides --layers)")
+    parser.add_argument("--layers", type=int, default=100)
+    add_arguments(parser)
+    args = parser.parse_args()
+    options = generator_options(args)
+    options["layers"] = args.layers
+    size, count = write_file(args.output, args.size, **options)
+    print(f"  Wrote {count} lines ({size / 1e6:.1f} MB) to {args.output}")
@@ -0,0 +1,171 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Checks that the scripts' faster paths give the same output as the line by line ones, on GCode Cura rarely writes.
+# Run with: python -m pytest Debug
+
+import os
+import re
+import sys
+
+import pytest
+
+DEBUG_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(os.path.dirname(DEBUG_DIR), "Scripts")
+for path in (DEBUG_DIR, SCRIPTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import MoveTable
+import AxisToAxis
+
+needs_numpy = pytest.mark.skipif(not MoveTable.available(), reason="needs NumPy")
+
+EXPONENTS = [
+    ";LAYER:0\nM82\nG92 E0\nG1 X10 Y10 E1.0e-3\nG1 X20 E2.5E-1 ; comment\nG1 X30 E1_0\nG1 E-1e1\nG0 X1e2 Y5\nG1 X40 E12.5\n",
+    ";LAYER:1\nG1 X50 E" + "1" * 40 + "\nG1 X60 E1.5e+2\nG1 X70 Einf\n",
+]
+
+@needs_numpy
+def test_table_reads_numbers_as_float():
+    table = MoveTable.parse("G1 X1.5 E1.0e-3\nG1 E-2E1 Xabc\nG1 E1_0\n", "XE")
+    assert table["E"].tolist() == [0.001, -20.0, 10.0]
+    assert MoveTable.has(table, "X").tolist() == [True, False, False]
+
+@needs_numpy
+def test_axis_to_axis_table_exponents():
+    for settings in [(True, ["M201", "M203"], [("E", ["A", "B"], [1.0, 0.5])]), (False, ["G0", "G1"], [("X", ["U"], [2.0]), ("E", ["A"], [1.0])])]:
+        assert AxisToAxis.convert_layers_table(settings, EXPONENTS) == AxisToAxis.convert_layers(settings, EXPONENTS)
+
+import ExternalExtruder
+
+G92 = [
+    ";LAYER:0\nM82\nG92 E0\nG1 X1 E1\nG1 X2 E2\nG92 E0\nG1 X3 E0.5\nG1 E0.2\nG1 E0.6\nG92 E10\n",
+    ";LAYER:1\nG1 X4 E11\nG0 X5\nM83\nG1 X6 E0.3\nG92 E0\nG1 X7 E0.1\nM82\nG1 X8 E0.5\n",
+]
+
+def external_extruder(layers, **values):
+    script = ExternalExtruder.ExternalExtruder()
+    script.KeyValue = dict(values)
+    return "".join(script.execute(list(layers)))
+
+@pytest.mark.parametrize("values", [{}, {"DWELL": True}, {"DWELL": True, "DWELL_MERGE": True}])
+def test_external_extruder_g92(values):
+    values = dict(values, EXRD_BACKWARDS="M64 P0; Reverse Extruder")
+    expected = external_extruder(G92, **values)
+    assert "Reverse Extruder\nG1 X3 E0.5" not in expected # G92 E0 then E0.5 isn't a retraction
+    assert "Reverse Extruder\nG1 E0.2" in expected
+    assert external_extruder(G92, PARALLEL=True, WORKERS=1, CHUNK_SIZE=1, **values) == expected
+    script = ExternalExtruder.ExternalExtruder()
+    script.KeyValue = dict(values)
+    assert "".join(script.executeStream("".join(G92).splitlines(keepends=True))) == expected
+
+@needs_numpy
+@pytest.mark.parametrize("layers", [EXPONENTS, G92])
+def test_external_extruder_table(layers):
+    for values in [{}, {"DWELL": True, "DWELL_MERGE": True}]:
+        assert external_extruder(layers, VECTORIZE=True, **values) == external_extruder(layers, **values)
+
+@pytest.mark.parametrize("Script", [AxisToAxis.AxisToAxis, ExternalExtruder.ExternalExtruder])
+def test_cached_layers_keep_their_numbers(Script, tmp_path):
+    layers = [";LAYER:0\nG1 X1 E1\n", ";LAYER:1\nG1 X2 E2\n", ";LAYER:2\nG1 X3 E3\n"]
+    for changed in (None, 1):
+        data = list(layers)
+        if changed is not None:
+            data[changed] = data[changed].replace("X", "Y")
+        script = Script()
+        script.KeyValue = {"CACHE": True, "CACHE_DIR": str(tmp_path), "INSTRUMENT": True}
+        script.execute(data)
+    records = script.instrumentation.layers
+    assert [record["layer"] for record in records] == [0, 1, 2]
+    assert [record.get("cached", 0) for record in records] == [1, 0, 1]
+
+import Batch
+
+def test_process_range_joins(tmp_path):
+    gcode = ";FLAVOR:Marlin\n;Generated with Cura\nM82\nG92 E0\n;é\n" + "".join(f";LAYER:{i}\nG1 X{i} E{i + 1}\nG92 E0\nG1 X{i}.5 E0.5\n" for i in range(6)) + ";End\n"
+    path = tmp_path / "part.gcode"
+    path.write_bytes(gcode.encode("utf-8"))
+    config = [("AxisToAxis", {}), ("ExternalExtruder", {"DWELL": True, "DWELL_MERGE": True})]
+    Batch.process_range(Batch.load_scripts(config), str(path), str(tmp_path / "all.gcode"), 0)
+    Batch.process_range(Batch.load_scripts(config), str(path), str(tmp_path / "a.gcode"), 0, 2)
+    Batch.process_range(Batch.load_scripts(config), str(path), str(tmp_path / "b.gcode"), 3)
+    assert (tmp_path / "a.gcode").read_bytes() + (tmp_path / "b.gcode").read_bytes() == (tmp_path / "all.gcode").read_bytes()
+
+import MoveTime
+
+DWELLS = [
+    ";LAYER:0\nM82\nG92 E0\nM204 S1000\nG1 F1800 X10 E1\nG1 F2400 E-0.5\nG0 F6000 X20\nG1 F2400 E1\n",
+    ";LAYER:1\nG1 X30 E2 F1200\nG1 E1.5\nG1 E2.5 F600\n",
+]
+
+def dwell_seconds(gcode):
+    return sum(float(line.split()[1][1:]) for line in gcode.splitlines() if line.endswith(MoveTime.ROBOT_DWELL))
+
+@needs_numpy
+def test_estimate_reads_robot_dwells_in_seconds():
+    output = external_extruder(DWELLS, DWELL_BACKWARD=True)
+    without = "".join(line for line in output.splitlines(keepends=True) if not line.startswith("G4"))
+    assert dwell_seconds(output) == pytest.approx(0.09) # 4.5 mm of E at the Stationary Feed Rate
+    assert MoveTime.estimate(output)[0][-1] == pytest.approx(MoveTime.estimate(without)[0][-1] + dwell_seconds(output))
+    assert MoveTime.estimate("G4 P500\nG4 S2\n")[0].tolist() == [0.5, 2.5]
+
+@needs_numpy
+@pytest.mark.parametrize("values", [{"DWELL_BACKWARD": True}, {"DWELL_MERGE": True}])
+def test_external_extruder_dwells_from_move_time(values):
+    values = dict(values, DWELL_BY="MOVE")
+    expected = external_extruder(DWELLS, **values)
+    # the E-only moves at their feed rate with M204 S1000: 1.5, 1.5, 0.5 and 1 mm of E
+    moves = [0.0775, 0.0775, 0.045, 0.11] if not values.get("DWELL_MERGE") else [0.0775, 0.11]
+    assert dwell_seconds(expected) == pytest.approx(sum(moves), abs=1e-3)
+    assert external_extruder(DWELLS, PARALLEL=True, WORKERS=1, CHUNK_SIZE=1, **values) == expected
+    script = ExternalExtruder.ExternalExtruder()
+    script.KeyValue = dict(values)
+    assert "".join(script.executeStream("".join(DWELLS).splitlines(keepends=True))) == expected
+
+@needs_numpy
+def test_lead_buffer_is_bounded(monkeypatch):
+    monkeypatch.setattr(MoveTime, "BATCH", 16)
+    # a single layer that starts or stops the extruder on every line, so each line has extruder GCode moved ahead of it, splitting the move before
+    lines = [";LAYER:0\n", "M83\n"] + [f"G1 F1200 X{i * 10} E0.1\n" if i % 2 else f"G0 F6000 X{i * 10}\n" for i in range(4000)]
+    consumed = 0
+    def source():
+        nonlocal consumed
+        for line in lines:
+            consumed += 1
+            yield line
+    script = ExternalExtruder.ExternalExtruder()
+    script.KeyValue = {"EXRD_LEAD": 0.05, "EXRD_LEAD_LINES": 4, "DWELL": False}
+    before, transform, after = script.getLineTransform()
+    held = 0
+    written = 0
+    output = []
+    for line in transform(source()):
+        output.append(line)
+        # the output lines that stand for a line read: not the extruder GCode, nor the first part of a split move (which has X to 3 decimals)
+        if "Extruder" not in line and not re.search(r"X\d+\.\d{3}", line):
+            written += 1
+        held = max(held, consumed - written)
+    assert held <= 16 + 4 + 1 # lines read ahead by MoveTime.Clock, then those held for the lead
+    assert "".join(output).count("Start Extruder") == 2000
+    assert MoveTime.estimate("".join(output))[1][:4] == pytest.approx(MoveTime.estimate("".join(lines))[1][:4]) # the moves are split, not changed
+
+@needs_numpy
+@pytest.mark.parametrize("values", [{"EXRD_LEAD": 0.3}, {"EXRD_LEAD": 2.0, "EXRD_LEAD_BY": "DISTANCE"}, {"EXRD_LEAD": 0.3, "DWELL_MERGE": True}])
+def test_lead_matches_layers_and_stream(values):
+    from Data import gcode
+    expected = external_extruder(gcode, **values)
+    assert expected != external_extruder(gcode)
+    assert external_extruder(gcode, PARALLEL=True, WORKERS=1, CHUNK_SIZE=7, **values) == expected
+    script = ExternalExtruder.ExternalExtruder()
+    script.KeyValue = dict(values)
+    assert "".join(script.executeStream("".join(gcode).splitlines(keepends=True))) == expected
+
+import Firmware
+
+@needs_numpy
+def test_simulate_reads_any_bytes(tmp_path):
+    gcode = b";LAYER:0\nG1 F1200 X10 E1\n;\xe9\xff\n;LAYER:1\nG1 X20 E2\n"
+    path = tmp_path / "part.gcode"
+    path.write_bytes(gcode)
+    report = Firmware.simulate(str(path), Firmware.Firmware())
+    assert report["seconds"] > 0 and report["commands"] == 2
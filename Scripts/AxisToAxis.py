@@ -10,11 +10,199 @@ if __name__ == "__main__":
     from Debug import Script
     print("Debug mode")
 else:
-    from ..Script import Script
+    try:
+        from ..Script import Script
+    except ImportError: # imported by name outside Cura, e.g. by a worker process
+        from Debug import Script
+
+import os
+import sys
+from time import perf_counter
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR) # shared modules (e.g. GCodeTokenizer.py) are placed next to the scripts
+from GCodeTokenizer import tokenize, find_word, compile_codes, transform_layer
+from LayerPool import map_layers
+import MoveTable
+from LayerCache import LayerCache
+from Instrumentation import Instrumentation
+
+def line_converter(settings, instrumentation=None):
+    """Returns a function that converts one line (with its line ending) for settings, built once per run.
+    Codes are looked up in a frozenset and each mapping's new words are written with a format made for its exact axes, e.g. "A{:.3f} B{:.3f} ".format.
+    For a single mapping to one or two axes (the usual case), tokenize, find_word and the multiplication are written out in it, as the calls cost more than the rest of the conversion.
+    Otherwise, and with instrumentation (where parsing and formatting are timed and the converted lines and axes written are counted), the general function is used.
+    """
+    EXCLUDE, CODES, Mappings = settings[:3]
+    CODES = frozenset(CODES)
+    parse = tokenize
+    formats = [(FROM, "".join(axis + "{:.3f} " for axis in Axes).format, Mults) for FROM, Axes, Mults in Mappings]
+    count = None
+    if instrumentation is not None:
+        parse = instrumentation.timed("parse", tokenize)
+        formats = [(FROM, instrumentation.timed("format", format_axes), Mults) for FROM, format_axes, Mults in formats]
+        count = instrumentation.count
+
+    if len(formats) == 1 and len(formats[0][2]) <= 2 and instrumentation is None:
+        (FROM, format_axes, Mults), = formats
+        Mult_0, Mult_1 = (list(Mults) + [0.0])[:2] # format_axes ignores the second value when there is one axis
+
+        def convert_line(line):
+            code, sep, comment = line.partition(";")
+            words = code.split()
+            if words and EXCLUDE != (words[0] in CODES): # if code is not excluded or code is included
+                for word in words:
+                    if word[0] == FROM and len(word) > 1:
+                        value = float(word[1:])
+                        return replace_word(code, sep + comment, word, format_axes(value * Mult_0, value * Mult_1))
+            return line
+        return convert_line
+
+    def convert_line(line):
+        command, words, code, comment = parse(line)
+        if command and EXCLUDE != (command in CODES): # if code is not excluded or code is included
+            replacements = []
+            written = 0
+            for FROM, format_axes, Mults in formats:
+                i = find_word(words, FROM)
+                if i >= 0:
+                    word = words[i]
+                    replacements.append((code.find(word), word, format_axes(*map(float(word[1:]).__mul__, Mults))))
+                    written += len(Mults)
+            if replacements:
+                if count is not None:
+                    count(modified=1, axes=written)
+                return replace_words(code, comment, replacements)
+        return line
+    return convert_line
+
+def convert_lines(settings, lines, instrumentation=None):
+    """Converts the axes in an iterable of lines (with their line endings) and yields the converted lines.
+    settings is (EXCLUDE, CODES, Mappings) from AxisToAxis.getSettings, where Mappings is a list of (FROM, Axes, Mults).
+    All of the mappings are applied to each line with a single parse of it (see line_converter, which is quicker to build once and use for many lines).
+    """
+    yield from map(line_converter(settings, instrumentation), lines)
+
+def replace_word(code, comment, word, new):
+    """Returns the line with word replaced by new (and a "\n" line ending)."""
+    if comment:
+        comment = comment.rstrip()
+    else:
+        code = code.rstrip()
+
+    start = code.find(word)
+    before_from = code[:start]
+    afterfrom = code[start + len(word):].lstrip()
+    if afterfrom:
+        afterfrom = " " + afterfrom
+
+    return before_from + new + afterfrom + comment + "\n"
+
+def replace_words(code, comment, replacements):
+    """Returns the line with words replaced (and a "\n" line ending).
+    replacements is a list of (code.find(word), word, new), so each new value only ever replaces its own word.
+    """
+    if comment:
+        comment = comment.rstrip()
+    else:
+        code = code.rstrip()
+
+    if len(replacements) > 1:
+        replacements.sort()
+    start, word, line = replacements[0]
+    line = code[:start] + line
+    end = start + len(word)
+    for start, word, new in replacements[1:]:
+        line += " " + code[end:start].lstrip() + new
+        end = start + len(word)
+    afterfrom = code[end:].lstrip()
+    if afterfrom:
+        afterfrom = " " + afterfrom
+
+    return line + afterfrom + comment + "\n"
+
+def line_needles(settings):
+    """Returns (needles, pattern) for GCodeTokenizer.transform_layer: every line convert_lines could change has an included code, or one of the FROM axes when excluding."""
+    EXCLUDE, CODES, Mappings = settings[:3]
+    needles = [FROM for FROM, Axes, Mults in Mappings] if EXCLUDE else CODES
+    return needles, compile_codes(needles)
+
+def convert_layers(settings, layers, instrumentation=None):
+    """Converts the axis in each layer. Returns a list of the converted layers.
+    Layers without a line that could be changed are returned as they are, and when there are few only those lines are split out (see GCodeTokenizer.transform_layer).
+    """
+    needles = line_needles(settings)
+    if instrumentation is not None:
+        return [instrumentation.process_layer(layer, lambda lines: convert_lines(settings, lines, instrumentation), needles) for layer in layers]
+    convert_line = line_converter(settings)
+    return [transform_layer(layer, lambda lines: map(convert_line, lines), *needles) for layer in layers]
+
+def convert_layers_table(settings, layers, instrumentation=None):
+    """Same as convert_layers, but parses each layer into a move table (see MoveTable.py).
+    The lines to change are selected and their values multiplied a whole column at a time, then only those lines are rebuilt.
+    """
+    EXCLUDE, CODES, Mappings = settings[:3]
+    np = MoveTable.np
+    FROMS = "".join(FROM for FROM, Axes, Mults in Mappings)
+    needles = line_needles(settings)[0]
+
+    converted = []
+    for layer in layers:
+        if not MoveTable.fits(layer):
+            converted.extend(convert_layers(settings, [layer], instrumentation))
+            continue
+        start = perf_counter()
+        if not any(needle in layer for needle in needles):
+            converted.append(layer)
+            if instrumentation is not None:
+                instrumentation.add("parse", perf_counter() - start)
+                instrumentation.count(lines=layer.count("\n") + (bool(layer) and not layer.endswith("\n")))
+                instrumentation.end_layer(perf_counter() - start)
+            continue
+        table = MoveTable.parse(layer, FROMS)
+        parsed = perf_counter()
+        command = table["command"]
+        found = [MoveTable.has(table, FROM) for FROM, Axes, Mults in Mappings]
+        rows = np.flatnonzero(np.logical_or.reduce(found) & (command != "") & (np.isin(command, CODES) != EXCLUDE))
+        # for each mapping, whether each row has its axis and the row's values for each of its axes (NaN when it hasn't)
+        columns = [(FROM, "".join(axis + "{:.3f} " for axis in Axes).format, mask[rows].tolist(), (table[FROM][rows, None] * Mults).tolist())
+                   for mask, (FROM, Axes, Mults) in zip(found, Mappings)]
+        starts = table["start"][rows].tolist()
+        ends = table["end"][rows].tolist()
+        transformed = perf_counter()
+
+        parts = []
+        last = 0
+        written = 0
+        for i in range(len(starts)):
+            command, words, code, comment = tokenize(layer[starts[i]:ends[i]])
+            replacements = []
+            for FROM, format_axes, has, values in columns:
+                if has[i]:
+                    word = words[find_word(words, FROM)]
+                    replacements.append((code.find(word), word, format_axes(*values[i])))
+                    written += len(values[i])
+            parts.append(layer[last:starts[i]])
+            parts.append(replace_words(code, comment, replacements))
+            last = ends[i]
+        parts.append(layer[last:])
+        formatted = perf_counter()
+        converted.append("".join(parts))
+
+        if instrumentation is not None:
+            end = perf_counter()
+            instrumentation.add("parse", parsed - start)
+            instrumentation.add("transform", transformed - parsed)
+            instrumentation.add("format", formatted - transformed)
+            instrumentation.add("join", end - formatted)
+            instrumentation.count(lines=len(table), modified=len(rows), axes=written)
+            instrumentation.end_layer(end - start)
+    return converted
 
 class AxisToAxis(Script):
     """Converts one axis to another, applying a multiplier.
     For example, from "E" to "A1.0 B0.5" will replace line "G1 X193.239 Y204.43 E0.530" with "G1 X193.239 Y204.43 A0.530 B0.265"
+    Several axes can be converted in one pass with Mappings, e.g. "E:A1.0,B0.5; Z:W2.0".
     """
 
     def getSettingDataString(self):
@@ -39,6 +227,13 @@ class AxisToAxis(Script):
                     "type": "str",
                     "default_value": "A1.0 B0.5"
                 },
+                "MAPPINGS":
+                {
+                    "label": "Mappings",
+                    "description": "Convert several axes in one pass instead of From and To, e.g. E:A1.0,B0.5; Z:W2.0 converts E to A and B and Z to W. Each axis is converted from its value in the original line. Leave empty to use From and To.",
+                    "type": "str",
+                    "default_value": ""
+                },
                 "EXCLUDE_INCLUDE":
                 {
                     "label": "Exclude or Include Codes",
@@ -62,70 +257,204 @@ class AxisToAxis(Script):
                     "type": "str",
                     "default_value": "G0 G1",
                     "enabled": "EXCLUDE_INCLUDE == 'INCLUDE'"
+                },
+                "PARALLEL":
+                {
+                    "label": "Parallel Processing",
+                    "description": "Convert chunks of layers in separate processes. For large files processed outside of Cura (e.g. from the command line).",
+                    "type": "bool",
+                    "default_value": false
+                },
+                "WORKERS":
+                {
+                    "label": "Worker Processes",
+                    "description": "Number of processes to use (0 uses one per CPU).",
+                    "type": "int",
+                    "minimum_value": "0",
+                    "default_value": 0,
+                    "enabled": "PARALLEL"
+                },
+                "CHUNK_SIZE":
+                {
+                    "label": "Layers Per Chunk",
+                    "description": "Number of layers sent to a process at a time.",
+                    "type": "int",
+                    "minimum_value": "1",
+                    "default_value": 64,
+                    "enabled": "PARALLEL"
+                },
+                "VECTORIZE":
+                {
+                    "label": "Use NumPy",
+                    "description": "Parse each layer into columns and convert whole columns at once. Falls back to converting line by line if NumPy is not available.",
+                    "type": "bool",
+                    "default_value": false
+                },
+                "CACHE":
+                {
+                    "label": "Cache Layers",
+                    "description": "Keep processed layers on disk and reuse them when the same layer is processed again with the same settings, e.g. when re-slicing a part after a small change.",
+                    "type": "bool",
+                    "default_value": false
+                },
+                "CACHE_DIR":
+                {
+                    "label": "Cache Folder",
+                    "description": "Folder for the cached layers. Leave empty to use a folder in the system's temporary folder.",
+                    "type": "str",
+                    "default_value": "",
+                    "enabled": "CACHE"
+                },
+                "CACHE_SIZE":
+                {
+                    "label": "Cache Size",
+                    "description": "Largest size of the cache. The layers used least recently are removed first.",
+                    "unit": "MB",
+                    "type": "int",
+                    "minimum_value": "1",
+                    "default_value": 1024,
+                    "enabled": "CACHE"
+                },
+                "INSTRUMENT":
+                {
+                    "label": "Instrumentation",
+                    "description": "Time each stage of processing and count the changes made. The results are added as comments below the script's information at the top of the GCode.",
+                    "type": "bool",
+                    "default_value": false
+                },
+                "INSTRUMENT_FILE":
+                {
+                    "label": "Instrumentation File",
+                    "description": "JSON file to also write the results to, including those of each layer. Leave empty for none.",
+                    "type": "str",
+                    "default_value": "",
+                    "enabled": "INSTRUMENT"
                 }
             }
         }"""
 
-    def execute(self, data):
+    def getSettings(self):
+        """Reads the settings into (EXCLUDE, CODES, Mappings, PARALLEL, WORKERS, CHUNK_SIZE, VECTORIZE, CACHE, CACHE_DIR, CACHE_SIZE, INSTRUMENT, INSTRUMENT_FILE).
+        Mappings is a list of (FROM, Axes, Mults), from MAPPINGS or otherwise just FROM and TO.
+        """
         EXCLUDE = str(self.getSettingValueByKey("EXCLUDE_INCLUDE")) == "EXCLUDE"
         if EXCLUDE:
             CODES = str(self.getSettingValueByKey("EXCLUDE_CODE")).split()
         else:
             CODES = str(self.getSettingValueByKey("INCLUDE_CODE")).split()
 
-        FROM = str(self.getSettingValueByKey("FROM"))
-        TO = str(self.getSettingValueByKey("TO")).split()
-
-        Axes = []
-        Mults = []
-        for s in TO:
-            Axes.append(s[0])
-            Mults.append(float(s[1:]))
-        count = len(Axes)
-
-        for layer_number, layer in enumerate(data):
-            lines = layer.splitlines(keepends=True)
-            for i in range(len(lines)):
-                code_split = lines[i].split()
-                if len(code_split) == 0:
-                    continue
-                if EXCLUDE != (code_split[0] in CODES): # if code is not excluded or code is included
-                    line_comment = lines[i].rstrip().split(";",1)
-                    if len(line_comment) == 2:
-                        comment = ";" + line_comment[1]
-                    else:
-                        comment = ""
-                    
-                    l = line_comment[0]
-                    if FROM in l:
-                        from_split = l.split(FROM,1)
-                        before_from = from_split[0]
-                        val_afterfrom = from_split[-1].split(None,1)
-                        if len(val_afterfrom) == 0:
-                            continue
-                        elif len(val_afterfrom) == 1:
-                            afterfrom = ""
-                        else:
-                            afterfrom = " " + val_afterfrom[1]
-                        val = float(val_afterfrom[0])
-
-                        new = ""
-                        for j in range(count):
-                            new += Axes[j] + "{:.3f} ".format(val * Mults[j])
-                        new.rstrip()
-    
-                        lines[i] = before_from + new + afterfrom + comment + "\n"
-            data[layer_number] = "".join(lines)
-
-        PrintInfo = f"""
+        MAPPINGS = str(self.getSettingValueByKey("MAPPINGS")).strip()
+        if MAPPINGS:
+            # a later mapping of the same axis replaces an earlier one
+            FROMS = {}
+            for mapping in MAPPINGS.split(";"):
+                if mapping.strip():
+                    FROM, TO = mapping.split(":", 1)
+                    FROMS[FROM.strip()] = TO.replace(",", " ").split()
+        else:
+            FROMS = {str(self.getSettingValueByKey("FROM")): str(self.getSettingValueByKey("TO")).split()}
+
+        Mappings = []
+        for FROM, TO in FROMS.items():
+            Axes = []
+            Mults = []
+            for s in TO:
+                Axes.append(s[0])
+                Mults.append(float(s[1:]))
+            Mappings.append((FROM, Axes, Mults))
+
+        PARALLEL = self.getSettingValueByKey("PARALLEL")
+        WORKERS = int(self.getSettingValueByKey("WORKERS"))
+        CHUNK_SIZE = int(self.getSettingValueByKey("CHUNK_SIZE"))
+        VECTORIZE = self.getSettingValueByKey("VECTORIZE") and MoveTable.available() and all(FROM in MoveTable.BIT for FROM in FROMS)
+        CACHE = self.getSettingValueByKey("CACHE")
+        CACHE_DIR = str(self.getSettingValueByKey("CACHE_DIR"))
+        CACHE_SIZE = int(self.getSettingValueByKey("CACHE_SIZE"))
+        INSTRUMENT = self.getSettingValueByKey("INSTRUMENT")
+        INSTRUMENT_FILE = str(self.getSettingValueByKey("INSTRUMENT_FILE"))
+
+        return EXCLUDE, CODES, Mappings, PARALLEL, WORKERS, CHUNK_SIZE, VECTORIZE, CACHE, CACHE_DIR, CACHE_SIZE, INSTRUMENT, INSTRUMENT_FILE
+
+    def getPrintInfo(self, settings):
+        EXCLUDE, CODES, Mappings = settings[:3]
+        conversions = "".join(f";    Axis Conversion: change all {FROM} to {Axes} with multipliers {Mults} (respectively)\n" for FROM, Axes, Mults in Mappings)
+        return f"""
 ;GCode edited with AxisToAxis.py script - Copyright (c) 2022 Michael Joyce-Badea
-;    Axis Conversion: change all {FROM} to {Axes} with multipliers {Mults} (respectively)
-;    Exclude/Include: {"Exclude" if EXCLUDE else "Include"} all {CODES} codes, {"exclude" if not EXCLUDE else "include"} everything else
+{conversions};    Exclude/Include: {"Exclude" if EXCLUDE else "Include"} all {CODES} codes, {"exclude" if not EXCLUDE else "include"} everything else
 
 """
-        data[0] = PrintInfo + data[0]
+
+    def execute(self, data):
+        settings = self.getSettings()
+        PARALLEL, WORKERS, CHUNK_SIZE, VECTORIZE, CACHE, CACHE_DIR, CACHE_SIZE, INSTRUMENT, INSTRUMENT_FILE = settings[3:]
+        convert = convert_layers_table if VECTORIZE else convert_layers
+        instrumentation = Instrumentation() if INSTRUMENT else None
+
+        layers = data
+        if CACHE:
+            # only the layers that aren't cached are converted
+            self.cache = LayerCache(CACHE_DIR, CACHE_SIZE)
+            keys = [self.cache.key(__file__, settings[:3], layer) for layer in data]
+            cached = [self.cache.get(key) for key in keys]
+            layers = [layer for layer, entry in zip(data, cached) if entry is None]
+
+        if PARALLEL:
+            start = perf_counter()
+            converted = map_layers(convert, settings, layers, WORKERS, CHUNK_SIZE)
+            if instrumentation is not None:
+                instrumentation.add("transform", perf_counter() - start)
+                if CACHE: # layers processed in other processes aren't recorded one by one
+                    instrumentation.count(cached=len(data) - len(layers))
+        elif CACHE and instrumentation is not None:
+            # converted in order, so each layer is recorded under its own number, cached or not
+            converted = []
+            for layer, entry in zip(data, cached):
+                if entry is None:
+                    converted.extend(convert(settings, [layer], instrumentation))
+                else:
+                    instrumentation.cached_layer()
+        else:
+            converted = convert(settings, layers, instrumentation)
+
+        if CACHE:
+            converted = iter(converted)
+            for i, entry in enumerate(cached):
+                if entry is None:
+                    cached[i] = (next(converted), None)
+                    self.cache.put(keys[i], cached[i][0])
+            converted = [entry[0] for entry in cached]
+        data[:] = converted
+
+        info = self.getPrintInfo(settings)
+        if instrumentation is not None:
+            self.instrumentation = instrumentation
+            info += instrumentation.comment()
+            if INSTRUMENT_FILE:
+                instrumentation.write(INSTRUMENT_FILE)
+        data[0] = info + data[0]
         return data
 
+    def getLineTransform(self):
+        """Returns (lines added before the GCode, function converting an iterable of lines, lines added after the GCode).
+        The function yields the output lines and can be called on one layer after another (see GCodePipeline.py).
+        """
+        settings = self.getSettings()
+        convert_line = line_converter(settings)
+        return self.getPrintInfo(settings).splitlines(keepends=True), lambda lines: map(convert_line, lines), []
+
+    def getLineNeedles(self):
+        """Returns the needles of getLineTransform's function: lines without any of them are passed through it unchanged and don't affect it (see GCodeStream.map_file)."""
+        return line_needles(self.getSettings())[0]
+
+    def executeStream(self, lines):
+        """Same as execute, but takes an iterable of lines instead of layers and yields the output lines.
+        Only one line is held at a time, so files of any size can be processed (see GCodeStream.py).
+        """
+        before, transform, after = self.getLineTransform()
+        yield from before
+        yield from transform(lines)
+        yield from after
+
 if __name__ == "__main__":
     print("Running DEBUG program...")
 
@@ -0,0 +1,122 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared index of a GCode file for the scripts in this folder and the tools in the Debug folder.
+# The byte offset of each ;LAYER: comment is found in one pass over the file
+# and kept in a small binary file next to it (<file>.idx), so layers can be read from anywhere in the file without scanning it again.
+# Scripts that carry state from layer to layer can keep their state at the start of each layer in it too (see Batch.process_range).
+# Copy this file into the same folder as the scripts that use it.
+
+import mmap
+import os
+import re
+import struct
+
+LAYER_RE = re.compile(rb"^;LAYER:(-?\d+)", re.MULTILINE)
+
+MAGIC = b"GCIX"
+VERSION = 2
+HEADER = struct.Struct("<4sHQqII") # magic, version, file size, file modified time (ns), layers, state sections
+ENTRY = struct.Struct("<qi") # offset, layer number
+COUNT = struct.Struct("<I")
+STATE_FORMATS = {bool: "?", int: "q", float: "d"}
+
+class GCodeIndex:
+    """Where the layers are in a GCode file of size bytes, last modified at mtime_ns.
+    entries is a list of (offset, layer number) in the order they are in the file.
+    states holds lists of the state of a script at the start of each layer (in the order of layers), by a key the script chooses.
+    """
+
+    def __init__(self, size, mtime_ns, entries, states=None):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.entries = entries
+        self.states = states if states is not None else {}
+
+    def layers(self):
+        """Returns a list of (layer number, offset of its ;LAYER: comment)."""
+        return [(number, offset) for offset, number in self.entries]
+
+    def layer_range(self, first, last=None):
+        """Returns (start, end), the byte offsets of layers first to last (to the end of the file if last is None).
+        A layer runs from its ;LAYER: comment to the next one, so the last layer includes the end GCode.
+        """
+        layers = self.layers()
+        numbers = [number for number, offset in layers]
+        for number in (first, last):
+            if number is not None and number not in numbers:
+                raise ValueError(f"Layer {number} is not in the file")
+        start = layers[numbers.index(first)][1]
+        end = self.size
+        if last is not None:
+            if last not in numbers[numbers.index(first):]:
+                raise ValueError(f"Layer {last} comes before layer {first}")
+            i = numbers.index(last, numbers.index(first))
+            if i + 1 < len(layers):
+                end = layers[i + 1][1]
+        return start, end
+
+    def layer_offsets(self):
+        """Offsets of the layers, for splitting the file into the part before the first layer and each layer."""
+        return [offset for number, offset in self.layers()]
+
+    def write(self, path):
+        temp = "{}.{}.tmp".format(path, os.getpid()) # written then renamed, so other processes never read part of an index
+        with open(temp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.size, self.mtime_ns, len(self.entries), len(self.states)))
+            f.write(b"".join(ENTRY.pack(*entry) for entry in self.entries))
+            for key, states in self.states.items():
+                row = struct.Struct("<" + "".join(STATE_FORMATS[type(value)] for value in states[0])) if states else COUNT
+                write_text(f, key)
+                write_text(f, row.format)
+                f.write(COUNT.pack(len(states)))
+                f.write(b"".join(row.pack(*state) for state in states))
+        os.replace(temp, path)
+
+def write_text(f, text):
+    data = text.encode("utf-8", "surrogateescape")
+    f.write(COUNT.pack(len(data)) + data)
+
+def read_text(f):
+    return f.read(COUNT.unpack(f.read(COUNT.size))[0]).decode("utf-8", "surrogateescape")
+
+def index_path(path):
+    return path + ".idx"
+
+def file_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+def build_index(path):
+    """Scans the GCode file at path and returns its GCodeIndex."""
+    size, mtime_ns = file_stamp(path)
+    entries = []
+    if size:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            entries = [(match.start(), int(match.group(1))) for match in LAYER_RE.finditer(mapped)]
+    return GCodeIndex(size, mtime_ns, entries)
+
+def read_index(path):
+    """Returns the GCodeIndex stored next to the GCode file at path, or None if there is none or the file has changed since."""
+    try:
+        with open(index_path(path), "rb") as f:
+            magic, version, size, mtime_ns, entry_count, state_count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or (size, mtime_ns) != file_stamp(path):
+                return None
+            entries = list(ENTRY.iter_unpack(f.read(ENTRY.size * entry_count)))
+            states = {}
+            for i in range(state_count):
+                key = read_text(f)
+                row = struct.Struct(read_text(f))
+                count = COUNT.unpack(f.read(COUNT.size))[0]
+                states[key] = list(row.iter_unpack(f.read(row.size * count))) if count else []
+    except (OSError, struct.error, UnicodeDecodeError):
+        return None
+    return GCodeIndex(size, mtime_ns, entries, states)
+
+def load_index(path):
+    """Returns the index of the GCode file at path, read from next to it, or made and written there if it is missing or out of date."""
+    index = read_index(path)
+    if index is None:
+        index = build_index(path)
+        index.write(index_path(path))
+    return index
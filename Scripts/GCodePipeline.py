@@ -0,0 +1,25 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared helper for running several of the scripts in this folder one layer at a time.
+# Copy this file into the same folder as the scripts that use it.
+
+from itertools import chain
+
+def run_pipeline(scripts, data):
+    """Same as running the execute of each script in turn on data (the list of layers), but one layer at a time.
+    Each layer goes through the line transform of every script (see getLineTransform) before the next layer is started,
+    so no list of layers is built between scripts. Each script still splits the layer into lines and tokenizes them itself,
+    so this is no faster than running execute of each script (which can skip lines or use a faster path).
+    """
+    stages = [script.getLineTransform() for script in scripts]
+    last = len(data) - 1
+    for i, layer in enumerate(data):
+        for before, transform, after in stages:
+            lines = transform(layer.splitlines(keepends=True)) # scripts can yield several lines at once, so the layer is split again for each
+            if i == 0:
+                lines = chain(before, lines)
+            if i == last:
+                lines = chain(lines, after)
+            layer = "".join(lines)
+        data[i] = layer
+    return data
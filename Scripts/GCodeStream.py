@@ -0,0 +1,78 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared helper for running the scripts in this folder over GCode files of any size outside of Cura.
+# Copy this file into the same folder as the scripts that use it.
+
+import mmap
+import os
+import re
+from itertools import chain
+
+from GCodeTokenizer import split_lines, SPARSE, SAMPLE
+
+NEVER = re.compile(rb"(?!)")
+
+BLOCK = 1 << 20 # bytes of a mapped file looked at a time
+
+def stream_file(scripts, input_path, output_path):
+    """Runs the executeStream of each script in turn over the lines of input_path and writes the result to output_path.
+    Lines are passed from one script to the next as they are produced, so memory use doesn't grow with the file size.
+    """
+    with open(input_path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f_in:
+        with open(output_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as f_out:
+            lines = f_in
+            for script in scripts:
+                lines = script.executeStream(split_lines(lines)) # scripts can yield several lines at once, e.g. with GCode inserted
+            f_out.writelines(lines)
+
+def map_file(scripts, input_path, output_path):
+    """Same as stream_file, but input_path is memory mapped and only the lines with one of the scripts' needles (see getLineNeedles) are decoded and passed to the scripts.
+    The bytes in between are written to output_path straight from the mapped file, without being decoded or copied, so the less the scripts change the quicker it is.
+    The file is looked at in blocks, and blocks where many lines have a needle (as in GCodeTokenizer.transform_layer) are decoded and passed to the scripts whole.
+    Falls back to stream_file for empty files and scripts without getLineNeedles, or that need every line.
+    """
+    script_needles = [script.getLineNeedles() if hasattr(script, "getLineNeedles") else None for script in scripts]
+    if not os.path.getsize(input_path) or None in script_needles:
+        stream_file(scripts, input_path, output_path)
+        return
+
+    needles = [needle.encode("utf-8", "surrogateescape") for needles in script_needles for needle in needles]
+    pattern = re.compile(b"|".join(re.escape(needle) for needle in needles)) if needles else NEVER
+    stages = [script.getLineTransform() for script in scripts]
+
+    with open(input_path, "rb") as f_in, open(output_path, "wb") as f_out:
+        with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            def release(end):
+                # the pages before end have been written, so they needn't count towards the memory used (where madvise is available)
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_DONTNEED, 0, end - end % mmap.PAGESIZE)
+
+            def found_lines():
+                # writes the lines without a needle and yields the ones with one, as GCodeTokenizer.skip_lines
+                size = len(mapped)
+                last = 0
+                while last < size:
+                    block_end = mapped.find(b"\n", last + BLOCK) + 1 or size
+                    sample = mapped[last:last + SAMPLE]
+                    if sum(sample.count(needle) for needle in needles) > sample.count(b"\n") * SPARSE:
+                        yield mapped[last:block_end].decode("utf-8", "surrogateescape")
+                        last = block_end
+                        release(last)
+                        continue
+                    match = pattern.search(mapped, last, block_end)
+                    while match:
+                        start = mapped.rfind(b"\n", last, match.start()) + 1 or last
+                        end = mapped.find(b"\n", match.end()) + 1 or size
+                        f_out.write(view[last:start])
+                        yield mapped[start:end].decode("utf-8", "surrogateescape")
+                        last = end
+                        match = pattern.search(mapped, end, block_end)
+                    f_out.write(view[last:block_end])
+                    last = block_end
+                    release(last)
+
+            lines = found_lines()
+            for before, transform, after in stages:
+                lines = chain(before, transform(split_lines(lines)), after) # as executeStream, so each script's added lines go through the scripts after it
+            for line in lines:
+                f_out.write(line.encode("utf-8", "surrogateescape"))
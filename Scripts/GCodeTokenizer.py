@@ -0,0 +1,89 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared G-code tokenizer used by the scripts in this folder.
+# Copy this file into the same folder as the scripts that use it.
+
+import re
+
+NEVER = re.compile(r"(?!)")
+
+# line breaks str.splitlines() splits at other than "\n", "\r\n" and "\r"
+OTHER_BREAKS = "\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+SPARSE = 0.25 # largest fraction of lines with a needle for skip_lines to be quicker than splitting every line
+SAMPLE = 1 << 12 # characters at the start of a layer the fraction is estimated from
+
+def tokenize(line):
+    """Splits one line of GCode into (command, words, code, comment) in a single pass.
+    code is everything before the first ";" and comment is the rest, so code + comment == line.
+    words are the words of code, each a letter followed by its value (e.g. ["G1", "X1.5", "E0.2"]).
+    command is the first word (e.g. "G1"), or "" for blank and comment only lines.
+    """
+    code, sep, comment = line.partition(";")
+    words = code.split()
+    return (words[0] if words else ""), words, code, sep + comment
+
+def splits_at_newlines(text):
+    """True when text.splitlines() splits at "\\n" only, so its lines can be found by searching for "\\n" (e.g. by skip_lines and in a move table)."""
+    if text.count("\r") != text.count("\r\n"):
+        return False
+    return not any(c in text for c in OTHER_BREAKS)
+
+def split_lines(chunks):
+    """Splits an iterable of chunks of GCode (each one or more lines, as yielded by the scripts) into single lines."""
+    for chunk in chunks:
+        yield from chunk.splitlines(keepends=True)
+
+def skip_lines(text, pattern, transform):
+    """Same as "".join(transform(text.splitlines(keepends=True))), but only the lines pattern is found in are split out and passed to transform.
+    The text in between is copied as it is, in runs, so pattern must be found in every line transform would change or learn something from.
+    transform must yield the output of each line before taking the next one (and nothing after the last), as the scripts do.
+    text must only have "\n" line breaks (see splits_at_newlines).
+    """
+    parts = []
+    append = parts.append
+
+    def found_lines():
+        last = 0
+        match = pattern.search(text)
+        while match:
+            start = text.rfind("\n", last, match.start()) + 1 or last
+            end = text.find("\n", match.end()) + 1 or len(text)
+            append(text[last:start])
+            yield text[start:end]
+            last = end
+            match = pattern.search(text, end)
+        append(text[last:])
+
+    for output in transform(found_lines()):
+        append(output)
+    return "".join(parts)
+
+def transform_layer(layer, transform, needles, pattern):
+    """Same as "".join(transform(layer.splitlines(keepends=True))) when only the lines with one of needles (before or after any ";") are changed or change transform's state.
+    pattern is compile_codes(needles). Layers without any are returned as they are, and when few lines have one only those are split out (see skip_lines).
+    How many lines have one is estimated from the start of the layer.
+    """
+    if not any(needle in layer for needle in needles):
+        return layer
+    sample = layer[:SAMPLE]
+    if sum(sample.count(needle) for needle in needles) > sample.count("\n") * SPARSE or not splits_at_newlines(layer):
+        return "".join(transform(layer.splitlines(keepends=True)))
+    return skip_lines(layer, pattern, transform)
+
+def find_word(words, letter):
+    """Returns the index of the first word in words for letter that has a value, or -1 if there is none.
+    The value is words[i][1:] and the word starts at code.find(words[i]).
+    """
+    for i, word in enumerate(words):
+        if word[0] == letter and len(word) > 1:
+            return i
+    return -1
+
+def compile_codes(codes):
+    """Precompiles a list of codes (e.g. ["G0", "G1"]) into one pattern.
+    pattern.search(code) is the same as any(c in code for c in codes).
+    """
+    if not codes:
+        return NEVER
+    return re.compile("|".join(re.escape(c) for c in codes))
@@ -0,0 +1,101 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared timers and counters for the scripts in this folder, to see where the time goes when a script runs.
+# Scripts only create an Instrumentation when it is turned on in their settings and pass None otherwise.
+# Timed versions of functions are picked once per layer rather than checked for on each line, so it costs nothing when it isn't used.
+# Copy this file into the same folder as the scripts that use it.
+
+import json
+from time import perf_counter
+
+from GCodeTokenizer import transform_layer
+
+STAGES = ["split", "parse", "transform", "format", "join"]
+
+class Instrumentation:
+    """Time spent in each stage of processing, with counters (lines, modified, ...) in total and for each layer processed.
+    Layers processed in other processes (Parallel Processing) are only timed as a whole, as part of transform.
+    """
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.stages = dict.fromkeys(STAGES, 0.0)
+        self.totals = {}
+        self.layers = []
+        self.current = {}
+
+    def add(self, stage, seconds):
+        self.stages[stage] += seconds
+
+    def timed(self, stage, function):
+        """Returns function wrapped to add the time of each call to stage."""
+        stages = self.stages
+        def timed_function(*args):
+            start = perf_counter()
+            result = function(*args)
+            stages[stage] += perf_counter() - start
+            return result
+        return timed_function
+
+    def count(self, **counters):
+        """Adds to the counters of the whole run and of the layer being processed."""
+        for name, value in counters.items():
+            self.totals[name] = self.totals.get(name, 0) + value
+            self.current[name] = self.current.get(name, 0) + value
+
+    def process_layer(self, layer, transform, needles=None):
+        """Same as "".join(transform(layer.splitlines(keepends=True))), timing the split, transform and join and recording the layer's counters.
+        Time spent in parse and format (see timed) while transforming is not counted as transform.
+        With needles (needles, pattern), the layer is passed to GCodeTokenizer.transform_layer instead, which splits and joins as it goes, so it is all timed as transform.
+        """
+        nested = self.stages["parse"] + self.stages["format"]
+        start = perf_counter()
+        if needles is not None:
+            count = layer.count("\n") + (bool(layer) and not layer.endswith("\n"))
+            split = perf_counter()
+            layer = transform_layer(layer, transform, *needles)
+            transformed = end = perf_counter()
+        else:
+            lines = layer.splitlines(keepends=True)
+            count = len(lines)
+            split = perf_counter()
+            output = list(transform(lines))
+            transformed = perf_counter()
+            layer = "".join(output)
+            end = perf_counter()
+
+        self.stages["split"] += split - start
+        self.stages["transform"] += transformed - split - (self.stages["parse"] + self.stages["format"] - nested)
+        self.stages["join"] += end - transformed
+        self.count(lines=count)
+        self.end_layer(end - start)
+        return layer
+
+    def end_layer(self, seconds):
+        """Records a layer that took seconds with the counters added since the last one."""
+        self.layers.append(dict(layer=len(self.layers), seconds=seconds, **self.current))
+        self.current = {}
+
+    def cached_layer(self, seconds=0.0):
+        """Records a layer found in a LayerCache instead of being processed, so the layers after it keep their numbers."""
+        self.count(cached=1)
+        self.end_layer(seconds)
+
+    def report(self):
+        return {"seconds": perf_counter() - self.start, "stages": self.stages, "totals": self.totals, "layers": self.layers}
+
+    def comment(self, slowest=5):
+        """The timings and totals as a block of GCode comments, with the slowest layers."""
+        report = self.report()
+        layers = sorted(self.layers, key=lambda layer: layer["seconds"], reverse=True)[:slowest]
+        return f""";Instrumentation (times in seconds)
+;   Total: {report["seconds"]:.3f}
+;   Stages: {", ".join(f"{stage} {seconds:.3f}" for stage, seconds in self.stages.items())}
+;   Counts: {", ".join(f"{name} {value}" for name, value in self.totals.items())}
+;   Slowest layers: {", ".join(f"{layer['layer']} ({layer['seconds']:.4f})" for layer in layers)}
+
+"""
+
+    def write(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=4)
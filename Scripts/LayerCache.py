@@ -0,0 +1,96 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared on-disk cache of processed layers for the scripts in this folder.
+# Re-slicing a part with small changes gives mostly identical layers, so each processed layer is stored under a hash of
+# the layer, the script (its source and the helper modules'), the settings that change its output and the state it starts from.
+# The least recently used layers are removed when the cache grows over its size limit.
+# Copy this file into the same folder as the scripts that use it.
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+DEFAULT_DIR = os.path.join(tempfile.gettempdir(), "gcode_layer_cache")
+
+# helper modules that change how the scripts process a layer, next to this file
+HELPERS = [os.path.join(os.path.dirname(os.path.abspath(__file__)), name) for name in ("GCodeTokenizer.py", "MoveTable.py")]
+
+ENTRY_RE = re.compile(r"[0-9a-f]{64}\Z") # names of cached layers, so other files in the directory are never counted or removed
+
+source_digests = {}
+
+def source_digest(path):
+    """Hash of a script's source, so a changed script doesn't use layers cached by the old one."""
+    if path not in source_digests:
+        with open(path, "rb") as f:
+            source_digests[path] = hashlib.sha256(f.read()).hexdigest()
+    return source_digests[path]
+
+class LayerCache:
+    """Processed layers (and the state after each) stored as files in directory, at most max_mb megabytes in total.
+    hits and misses count the lookups since the cache was opened.
+    """
+
+    def __init__(self, directory="", max_mb=1024):
+        self.directory = directory or DEFAULT_DIR
+        self.max_bytes = max_mb * (1 << 20)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self.size = sum(entry.stat().st_size for entry in self.entries())
+
+    def key(self, script_path, settings, layer, state=None):
+        """Key for a layer processed by the script at script_path with settings (anything JSON can store), starting from state."""
+        sources = [source_digest(path) for path in [script_path] + HELPERS]
+        digest = hashlib.sha256(json.dumps([sources, settings, state]).encode())
+        digest.update(layer.encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Returns (processed layer, state after it) stored under key, or None if it isn't cached."""
+        path = os.path.join(self.directory, key)
+        try:
+            with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+                state = json.loads(f.readline())
+                layer = f.read()
+            os.utime(path) # modified time is the last use
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return layer, (tuple(state) if state is not None else None)
+
+    def put(self, key, layer, state=None):
+        """Stores a processed layer (and the state after it) under key, then removes the least recently used layers if the cache is too big."""
+        path = os.path.join(self.directory, key)
+        temp = "{}.{}.tmp".format(path, os.getpid()) # written then renamed, so other processes never read part of a layer
+        with open(temp, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+            f.write(json.dumps(state) + "\n")
+            f.write(layer)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        os.replace(temp, path)
+        self.size += os.path.getsize(path) - replaced
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def entries(self):
+        """The cached layers in directory, as os.DirEntry."""
+        return [entry for entry in os.scandir(self.directory) if ENTRY_RE.match(entry.name) and entry.is_file()]
+
+    def evict(self):
+        """Removes the least recently used layers until the cache is under 90% of its size limit."""
+        entries = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self.entries())
+        self.size = sum(size for mtime, size, path in entries)
+        for mtime, size, path in entries:
+            if self.size <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+            except OSError: # removed by another process
+                pass
+            self.size -= size
@@ -0,0 +1,61 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared process pool used by the scripts in this folder to process layers in parallel.
+# Copy this file into the same folder as the scripts that use it.
+
+import importlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+def chunk_layers(data, chunk_size):
+    """Splits data into consecutive lists of at most chunk_size layers."""
+    chunk_size = max(1, int(chunk_size))
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+def pool_size(workers, chunk_count):
+    """Number of processes to start for chunk_count chunks, or 0 if they should be run in this process
+    (one worker or chunk, or inside a frozen application such as Cura itself).
+    workers <= 0 uses one worker per CPU.
+    """
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers == 1 or chunk_count <= 1 or getattr(sys, "frozen", False):
+        return 0
+    return min(workers, chunk_count)
+
+def run_chunk(module_name, function_name, settings, *args):
+    """Worker entry point. Imports the script by name (the scripts folder is on sys.path) and runs its layer function."""
+    function = getattr(importlib.import_module(module_name), function_name)
+    return function(settings, *args)
+
+def map_chunks(function, settings, chunks, workers=0, states=None):
+    """Runs function(settings, layers) on each chunk in a process pool and returns the results in order.
+    If states is given it holds the entry state of each chunk and function(settings, layers, state) is called instead.
+    function must be defined at module level in a script.
+    """
+    if states is None:
+        args = [(chunk,) for chunk in chunks]
+    else:
+        args = list(zip(chunks, states))
+    processes = pool_size(workers, len(chunks))
+    if not processes:
+        return [function(settings, *a) for a in args]
+
+    module_name = os.path.splitext(os.path.basename(function.__globals__["__file__"]))[0]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(run_chunk, module_name, function.__name__, settings, *a) for a in args]
+        return [future.result() for future in futures]
+
+def map_layers(function, settings, data, workers=0, chunk_size=64):
+    """Runs function(settings, layers) on chunks of data in a process pool and returns all processed layers in order.
+    function must be defined at module level in a script and return a list with one entry per layer it was given.
+    """
+    chunks = chunk_layers(data, chunk_size)
+    if not pool_size(workers, len(chunks)):
+        return function(settings, data)
+
+    layers = []
+    for result in map_chunks(function, settings, chunks, workers):
+        layers.extend(result)
+    return layers
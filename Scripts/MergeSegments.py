@@ -0,0 +1,555 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# For use with Cura 4.x
+# Place this script in C:\Program Files\Ultimaker Cura 4.x\plugins\PostProcessingPlugin\scripts
+
+# For use with Cura 5.x
+# Place this script in C:\Program Files\Ultimaker Cura 5.x\share\cura\plugins\PostProcessingPlugin\scripts
+
+if __name__ == "__main__":
+    from Debug import Script
+    print("Debug mode")
+else:
+    try:
+        from ..Script import Script
+    except ImportError: # imported by name outside Cura, e.g. by a worker process
+        from Debug import Script
+
+import math
+import os
+import re
+import sys
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR) # shared modules (e.g. GCodeTokenizer.py) are placed next to the scripts
+from GCodeTokenizer import tokenize, find_word
+import MoveTable
+from MoveTime import carried
+
+START_STATE = (0.0, 0.0, 0.0, True, True) # (X, Y, E_Last, Absolute, E_Absolute)
+
+BLOCK = 1 << 20 # points of windows checked at a time by window_fits
+TABLE_SIZE = 1 << 22 # characters of GCode parsed into one move table
+
+MODE_RE = re.compile(r"^[^\S\n]*(?:G9[012]|G28|M8[23])(?![\d.])", re.MULTILINE) # lines merge_table leaves to merge_lines
+
+NUMBER = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)\Z") # a number as MoveTable reads it
+
+def number(word):
+    """Returns the value of word (e.g. "X1.5"), or None if it isn't a number as MoveTable.parse reads it."""
+    if len(word) - 1 <= MoveTable.WIDTH and NUMBER.match(word, 1):
+        return float(word[1:])
+    return None
+
+def segment(words, state):
+    """Returns (X, Y, E move, E word) of a G1 line that could be merged with others, or None. E move and E word are None when it doesn't extrude.
+    It must only move X and Y (and E, forwards), in absolute positioning, with no word given twice.
+    """
+    X, Y, E_Last, Absolute, E_Absolute = state
+    if not Absolute:
+        return None
+    values = {}
+    for word in words[1:]:
+        if word[0] not in "XYEF" or word[0] in values:
+            return None
+        values[word[0]] = number(word)
+        if values[word[0]] is None:
+            return None
+    if "X" not in values and "Y" not in values:
+        return None
+    x = values.get("X", X)
+    y = values.get("Y", Y)
+    if x == X and y == Y:
+        return None
+    if "E" not in values:
+        return x, y, None, None
+    E = values["E"] - E_Last if E_Absolute else values["E"]
+    if E <= 0:
+        return None
+    return x, y, E, next(word for word in words if word[0] == "E")
+
+def line_fits(points, TOLERANCE):
+    """True when the points (each (X, Y)) between the first and the last are within TOLERANCE of the line from the first to the last."""
+    sx, sy = points[0]
+    dx = points[-1][0] - sx
+    dy = points[-1][1] - sy
+    length = dx * dx + dy * dy
+    limit = TOLERANCE * TOLERANCE
+    for x, y in points[1:-1]:
+        px = x - sx
+        py = y - sy
+        t = min(max((px * dx + py * dy) / length, 0.0), 1.0) if length else 0.0
+        ex = t * dx - px
+        ey = t * dy - py
+        if ex * ex + ey * ey > limit:
+            return False
+    return True
+
+def arc_fit(points, TOLERANCE):
+    """Returns (I, J, clockwise) of the arc from the first to the last of points (each (X, Y)), or None when they don't lie on one.
+    The arc is on the circle through the first, middle and last points, with its centre at I, J from the first point. Every point, and the middle of the line
+    from each point to the next, must be within TOLERANCE of the circle, and the points must go round it one way, less than half a turn from the first.
+    Only +, -, *, / and square roots are used, so the vectorized version in merge_table gives the same results.
+    """
+    sx, sy = points[0]
+    bx = points[(len(points) - 1) // 2][0] - sx
+    by = points[(len(points) - 1) // 2][1] - sy
+    cx = points[-1][0] - sx
+    cy = points[-1][1] - sy
+    d = 2 * (bx * cy - by * cx)
+    if d == 0:
+        return None
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    I = (cy * b2 - by * c2) / d
+    J = (bx * c2 - cx * b2) / d
+    R = math.sqrt(I * I + J * J)
+    previous_x = previous_y = 0.0
+    for x, y in points[1:]:
+        px = x - sx
+        py = y - sy
+        mx = (previous_x + px) * 0.5
+        my = (previous_y + py) * 0.5
+        if abs(math.sqrt((px - I) * (px - I) + (py - J) * (py - J)) - R) > TOLERANCE or abs(math.sqrt((mx - I) * (mx - I) + (my - J) * (my - J)) - R) > TOLERANCE:
+            return None
+        if ((previous_x - I) * (py - J) - (previous_y - J) * (px - I)) * d <= 0 or ((-I) * (py - J) - (-J) * (px - I)) * d < 0:
+            return None
+        previous_x = px
+        previous_y = py
+    return I, J, d < 0
+
+def merged_line(run, E, E_Absolute, arc=None):
+    """Returns the line replacing a run of moves (see merge_lines): a G1 move, or a G2/G3 arc for an arc (I, J, clockwise) from arc_fit.
+    run is a list of [line, words, X, Y, ...] of the moves, and E is the E of all of them.
+    """
+    if arc is None:
+        words = ["G1"]
+    else:
+        words = ["G2" if arc[2] else "G3"]
+    words.extend(word for word in run[0][1] if word[0] == "F")
+    line, last, x, y = run[-1][:4]
+    for letter, value in (("X", x), ("Y", y)):
+        word = [word for word in last if word[0] == letter]
+        words.append(word[0] if word else letter + "{:.3f}".format(value))
+    if arc is not None:
+        words.append("I{:.3f}".format(arc[0]))
+        words.append("J{:.3f}".format(arc[1]))
+    if E is not None:
+        E_words = [word for words in (entry[1] for entry in run) for word in words if word[0] == "E"]
+        if E_Absolute:
+            words.append(E_words[-1])
+        else:
+            # as many places as the most precise E word, so the sum is exact
+            places = max(len(word) - word.find(".") - 1 if "." in word else 0 for word in E_words)
+            words.append("E{:.{}f}".format(E, places))
+    return " ".join(words) + "\n"
+
+def merge_lines(settings, lines, state):
+    """Merges runs of consecutive G1 moves that lie along a nearly straight line (or an arc, with ARCS) into one move, and yields the output lines.
+    A move is added to the run before it when every point of the run is within TOLERANCE mm of the line from the start of the run to the end of the move
+    (see line_fits) or of an arc through them (see arc_fit), the run has fewer than WINDOW moves, the move has no F word, and it extrudes at a rate (E per mm)
+    within FLOW_TOLERANCE of the run's, or doesn't extrude like the rest of the run. So each line is compared with at most WINDOW points and the time taken grows
+    linearly with the number of lines. The merged move keeps the F word of the first move and ends where the last one does, with the E of the last move
+    in absolute extrusion (M82) or the sum of the E of the moves in relative extrusion (M83). Lines with comments or other words aren't merged.
+    With a WINDOW of 1 nothing is merged, and only the state is followed.
+    state is the state list (see START_STATE), which is updated once all lines have been processed.
+    """
+    TOLERANCE, WINDOW, FLOW_TOLERANCE, ARCS = settings[:4]
+    X, Y, E_Last, Absolute, E_Absolute = state
+    run = [] # [line, words, X, Y, E move] of the moves held to be merged
+    points = [] # (X, Y) at the start of the run and the end of each of its moves
+    run_E = run_length = 0.0 # E and length of the run, for its extrusion per mm
+    arc = None # the arc of the run from arc_fit, None when it is a line
+
+    def merged():
+        if len(run) == 1:
+            return run[0][0]
+        return merged_line(run, run_E if run[0][4] is not None else None, E_Absolute, arc)
+
+    for line in lines:
+        command, words, code, comment = tokenize(line)
+        move = segment(words, (X, Y, E_Last, Absolute, E_Absolute)) if command == "G1" and not comment else None
+        if move is not None:
+            x, y, E, E_word = move
+            length = math.sqrt((x - X) * (x - X) + (y - Y) * (y - Y))
+            extend = bool(run) and len(run) < WINDOW and (E is None) == (run[0][4] is None) and not any(word[0] == "F" for word in words)
+            if extend and E is not None:
+                extend = abs(E / length * run_length / run_E - 1) <= FLOW_TOLERANCE
+            if extend:
+                points.append((x, y))
+                if line_fits(points, TOLERANCE):
+                    arc = None
+                else:
+                    fit = arc_fit(points, TOLERANCE) if ARCS else None
+                    if fit is None:
+                        extend = False
+                    else:
+                        arc = fit
+            if not extend:
+                if run:
+                    yield merged()
+                run = []
+                points = [(X, Y), (x, y)]
+                run_E = run_length = 0.0
+                arc = None
+            run.append([line, words, x, y, E])
+            run_length += length
+            X, Y = x, y
+            if E is not None:
+                run_E += E
+                E_Last = float(E_word[1:]) if E_Absolute else E_Last + E
+            continue
+
+        if run:
+            yield merged()
+            run = []
+        if command in ("G0", "G1", "G2", "G3", "G92"):
+            for letter in "XYE":
+                word = find_word(words, letter)
+                value = number(words[word]) if word >= 0 else None
+                if value is None:
+                    continue
+                absolute = command == "G92" or (E_Absolute if letter == "E" else Absolute)
+                if letter == "X":
+                    X = value if absolute else X + value
+                elif letter == "Y":
+                    Y = value if absolute else Y + value
+                else:
+                    E_Last = value if absolute else E_Last + value
+        elif command == "G28":
+            # homed axes are at 0, all of them when none are given (as MoveTime reads it)
+            given = [letter for letter in "XYZ" if find_word(words, letter) >= 0 and number(words[find_word(words, letter)]) is not None]
+            if "X" in given or not given:
+                X = 0.0
+            if "Y" in given or not given:
+                Y = 0.0
+        elif command == "G90" or command == "G91":
+            Absolute = E_Absolute = command == "G90"
+        elif command == "M82" or command == "M83":
+            E_Absolute = command == "M82"
+        yield line
+
+    if run:
+        yield merged()
+    state[:] = X, Y, E_Last, Absolute, E_Absolute
+
+def window_fits(Xs, Ys, first, k, TOLERANCE, ARCS):
+    """Vectorized line_fits and arc_fit for the windows of k + 2 points starting at each of first in the positions Xs, Ys (k + 1 moves each).
+    Returns (line fits, arc fits, I, J, clockwise) for each window, with arc fits False where the line fits. Windows are checked BLOCK points at a time.
+    """
+    np = MoveTable.np
+    line = np.zeros(len(first), bool)
+    arc = np.zeros(len(first), bool)
+    I = np.zeros(len(first))
+    J = np.zeros(len(first))
+    clockwise = np.zeros(len(first), bool)
+    step = max(BLOCK // (k + 2), 1)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for block in range(0, len(first), step):
+            rows = slice(block, block + step)
+            starts = first[rows]
+            index = starts[:, None] + np.arange(k + 2)
+            px = Xs[index] - Xs[starts][:, None]
+            py = Ys[index] - Ys[starts][:, None]
+
+            dx = px[:, -1:]
+            dy = py[:, -1:]
+            length = dx * dx + dy * dy
+            t = np.clip(np.where(length > 0, (px[:, 1:-1] * dx + py[:, 1:-1] * dy) / length, 0.0), 0.0, 1.0)
+            ex = t * dx - px[:, 1:-1]
+            ey = t * dy - py[:, 1:-1]
+            line[rows] = fits = (ex * ex + ey * ey <= TOLERANCE * TOLERANCE).all(1)
+            if not ARCS or fits.all():
+                continue
+
+            px = px[~fits]
+            py = py[~fits]
+            bx = px[:, (k + 1) // 2]
+            by = py[:, (k + 1) // 2]
+            cx = px[:, -1]
+            cy = py[:, -1]
+            d = 2 * (bx * cy - by * cx)
+            b2 = bx * bx + by * by
+            c2 = cx * cx + cy * cy
+            centre_x = (cy * b2 - by * c2) / d
+            centre_y = (bx * c2 - cx * b2) / d
+            R = np.sqrt(centre_x * centre_x + centre_y * centre_y)[:, None]
+            Ic = centre_x[:, None]
+            Jc = centre_y[:, None]
+            dc = d[:, None]
+            x = px[:, 1:]
+            y = py[:, 1:]
+            mx = (px[:, :-1] + x) * 0.5
+            my = (py[:, :-1] + y) * 0.5
+            on = (np.abs(np.sqrt((x - Ic) * (x - Ic) + (y - Jc) * (y - Jc)) - R) <= TOLERANCE) & (np.abs(np.sqrt((mx - Ic) * (mx - Ic) + (my - Jc) * (my - Jc)) - R) <= TOLERANCE)
+            turns = (((px[:, :-1] - Ic) * (y - Jc) - (py[:, :-1] - Jc) * (x - Ic)) * dc > 0) & (((-Ic) * (y - Jc) - (-Jc) * (x - Ic)) * dc >= 0)
+            found = np.flatnonzero(~fits) + block
+            arc[found] = (d != 0) & (on & turns).all(1)
+            I[found] = centre_x
+            J[found] = centre_y
+            clockwise[found] = d < 0
+    return line, arc, I, J, clockwise
+
+def merge_table(settings, layers, state):
+    """Same as merge_lines on each of a list of layers, but works on their move table (see MoveTable.py). Returns the list of merged layers.
+    The runs of all the chains of moves that could be merged are found together, a run of each chain at a time: each run is grown one move at a time
+    with the windows of points checked together (see window_fits), and the next run of the chain starts where it stops. Only the lines of runs are rebuilt.
+    The layers must not change positioning or extrusion mode or set or home the position (see merge_layers).
+    """
+    np = MoveTable.np
+    TOLERANCE, WINDOW, FLOW_TOLERANCE, ARCS = settings[:4]
+    if not layers:
+        return []
+    X, Y, E_Last, Absolute, E_Absolute = state
+    text = "".join(layers)
+    table = MoveTable.parse(text, "XYEF")
+    count = len(table)
+    if not count:
+        return list(layers)
+    command = table["command"]
+    starts = table["start"]
+    offsets = np.cumsum([0] + [len(layer) for layer in layers])
+    layer_start = np.zeros(count, bool) # moves can't be merged with the last move of the layer before
+    layer_start[np.searchsorted(starts, offsets[:-1])[offsets[:-1] < len(text)]] = True
+
+    # position after each line, and before each one in Xs and Ys
+    move = np.isin(command, ("G0", "G1", "G2", "G3"))
+    has = {letter: MoveTable.has(table, letter) for letter in "XYEF"}
+    X_after = carried(has["X"] & move, table["X"], X)
+    Y_after = carried(has["Y"] & move, table["Y"], Y)
+    E_given = has["E"] & move
+    if E_Absolute:
+        E_after = carried(E_given, table["E"], E_Last)
+        E_move = np.where(E_given, table["E"] - np.concatenate(([E_Last], E_after[:-1])), 0.0)
+    else:
+        E_move = np.where(E_given, table["E"], 0.0)
+        E_after = np.add.accumulate(np.concatenate(([E_Last], E_move)))[1:]
+    Xs = np.concatenate(([X], X_after))
+    Ys = np.concatenate(([Y], Y_after))
+    dx = Xs[1:] - Xs[:-1]
+    dy = Ys[1:] - Ys[:-1]
+    length = np.sqrt(dx * dx + dy * dy)
+
+    # moves segment would return, from lines with only X, Y, E and F words and no comment
+    chars = np.frombuffer(text.encode("latin-1", "replace"), np.uint8)
+    commented = (table["comment"] < len(chars)) & (chars[np.minimum(table["comment"], len(chars) - 1)] == 59)
+    words = 1 + has["X"].astype(int) + has["Y"] + has["E"] + has["F"]
+    travel = ~has["E"]
+    candidate = (command == "G1") & ~commented & (table["words"] == words) & (has["X"] | has["Y"]) & ((dx != 0) | (dy != 0)) & (travel | (E_move > 0))
+    follows = np.zeros(count, bool) # moves that could be added to a run ending at the line before
+    follows[1:] = candidate[1:] & candidate[:-1] & ~layer_start[1:] & ~has["F"][1:]
+
+    # runs as merge_lines finds them, starting with the first move of each chain, then where each run stops
+    runs = []
+    active = np.flatnonzero(candidate & ~np.concatenate(([False], candidate[:-1] & ~layer_start[1:])))
+    while len(active):
+        ends = active + 1
+        run_E = E_move[active]
+        run_length = length[active]
+        I = np.full(len(active), np.nan) # centre of the arc of each run, NaN for a line
+        J = np.full(len(active), np.nan)
+        clockwise = np.zeros(len(active), bool)
+        alive = np.arange(len(active))
+        for k in range(1, WINDOW):
+            last = active[alive] + k
+            alive = alive[last < count]
+            first = active[alive]
+            last = first + k
+            extend = follows[last] & (travel[last] == travel[first])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                flow = np.abs(E_move[last] / length[last] * run_length[alive] / run_E[alive] - 1) <= FLOW_TOLERANCE
+            alive = alive[extend & (travel[first] | flow)]
+            if not len(alive):
+                break
+            first = active[alive]
+            line, arc, arc_I, arc_J, arc_clockwise = window_fits(Xs, Ys, first, k, TOLERANCE, ARCS)
+            extend = line | arc
+            alive = alive[extend]
+            last = first[extend] + k
+            ends[alive] = last + 1
+            run_length[alive] += length[last]
+            run_E[alive] += E_move[last]
+            arc = arc[extend]
+            I[alive] = np.where(arc, arc_I[extend], np.nan)
+            J[alive] = np.where(arc, arc_J[extend], np.nan)
+            clockwise[alive] = arc_clockwise[extend]
+        merged = ends - active > 1
+        runs.append((active[merged], ends[merged], run_E[merged], I[merged], J[merged], clockwise[merged]))
+        ends = ends[ends < count]
+        active = ends[candidate[ends] & ~layer_start[ends]]
+
+    # rebuild the lines of the runs, layer by layer
+    first, ends, run_E, I, J, clockwise = (np.concatenate(column) for column in zip(*runs)) if runs else [np.zeros(0, int)] * 6
+    order = np.argsort(first)
+    stops = table["end"].tolist()
+    starts = starts.tolist()
+    processed = []
+    r = 0
+    for i, layer in enumerate(layers):
+        parts = []
+        copied = int(offsets[i])
+        while r < len(order) and starts[first[order[r]]] < offsets[i + 1]:
+            run = order[r]
+            rows = range(first[run], ends[run])
+            lines = [[None, tokenize(text[starts[row]:stops[row]])[1]] for row in rows]
+            lines[-1] += [float(X_after[rows[-1]]), float(Y_after[rows[-1]])]
+            arc = None if np.isnan(I[run]) else (float(I[run]), float(J[run]), bool(clockwise[run]))
+            parts.append(text[copied:starts[rows[0]]])
+            parts.append(merged_line(lines, None if travel[rows[0]] else float(run_E[run]), E_Absolute, arc))
+            copied = stops[rows[-1]]
+            r += 1
+        parts.append(text[copied:int(offsets[i + 1])])
+        processed.append("".join(parts))
+
+    state[:] = float(X_after[-1]), float(Y_after[-1]), float(E_after[-1]), Absolute, E_Absolute
+    return processed
+
+def merge_layers(settings, layers, state):
+    """Merges the moves of each layer, starting from state. Returns the list of merged layers.
+    With VECTORIZE, runs of layers that don't change positioning or extrusion mode or set or home the position are joined into one move table
+    of up to TABLE_SIZE characters (see merge_table), and merge_lines is used for the others.
+    """
+    processed = []
+    batch = []
+    size = 0
+    for layer in layers:
+        if not (settings[4] and state[3] and MoveTable.fits(layer) and not MODE_RE.search(layer)):
+            processed.extend(merge_table(settings, batch, state))
+            batch = []
+            size = 0
+            processed.append("".join(merge_lines(settings, layer.splitlines(keepends=True), state)))
+            continue
+        batch.append(layer)
+        size += len(layer)
+        if size >= TABLE_SIZE or not layer.endswith("\n"): # lines can't run on into the next layer
+            processed.extend(merge_table(settings, batch, state))
+            batch = []
+            size = 0
+    processed.extend(merge_table(settings, batch, state))
+    return processed
+
+class MergeSegments(Script):
+    """Merges runs of short G1 moves that lie along a nearly straight line into one move, for printers limited by how many commands they can take a second.
+    Run it before the other scripts, so they have fewer lines to process.
+    """
+
+    def getSettingDataString(self):
+        return """{
+            "name": "Merge Segments",
+            "key": "MergeSegments",
+            "metadata": {},
+            "version": 2,
+            "settings":
+            {
+                "TOLERANCE":
+                {
+                    "label": "Tolerance",
+                    "description": "Furthest the ends of the merged moves can be from the merged move.",
+                    "unit": "mm",
+                    "type": "float",
+                    "minimum_value": "0",
+                    "default_value": 0.01
+                },
+                "WINDOW":
+                {
+                    "label": "Most Moves Merged",
+                    "description": "Largest number of moves merged into one. Each move is checked against the moves merged before it, so larger numbers take longer.",
+                    "type": "int",
+                    "minimum_value": "2",
+                    "default_value": 32
+                },
+                "FLOW_TOLERANCE":
+                {
+                    "label": "Flow Tolerance",
+                    "description": "Largest difference in the extrusion per mm of the moves merged, as a percentage.",
+                    "unit": "%",
+                    "type": "float",
+                    "minimum_value": "0",
+                    "default_value": 5
+                },
+                "ARCS":
+                {
+                    "label": "Fit Arcs",
+                    "description": "Also merge moves that lie along an arc into one G2 or G3 arc. For Axis to Axis to convert the E of the arcs, add G2 G3 to its Include codes.",
+                    "type": "bool",
+                    "default_value": false
+                },
+                "VECTORIZE":
+                {
+                    "label": "Use NumPy",
+                    "description": "Parse each layer into columns and check where moves can be merged for all of them at once. Falls back to checking line by line if NumPy is not available.",
+                    "type": "bool",
+                    "default_value": false
+                }
+            }
+        }"""
+
+    def getSettings(self):
+        """Reads the settings into (TOLERANCE, WINDOW, FLOW_TOLERANCE, ARCS, VECTORIZE), with FLOW_TOLERANCE as a fraction."""
+        TOLERANCE = float(self.getSettingValueByKey("TOLERANCE"))
+        WINDOW = max(int(self.getSettingValueByKey("WINDOW")), 1)
+        FLOW_TOLERANCE = float(self.getSettingValueByKey("FLOW_TOLERANCE")) / 100
+        ARCS = self.getSettingValueByKey("ARCS")
+        VECTORIZE = self.getSettingValueByKey("VECTORIZE") and MoveTable.available()
+        return TOLERANCE, WINDOW, FLOW_TOLERANCE, ARCS, VECTORIZE
+
+    def getPrintInfo(self, settings):
+        TOLERANCE, WINDOW, FLOW_TOLERANCE, ARCS = settings[:4]
+        return f"""
+;GCode edited with MergeSegments.py script - Copyright (c) 2022 Michael Joyce-Badea
+;    Merge Segments: up to {WINDOW} G1 moves within {TOLERANCE} mm of a straight line{" or arc" if ARCS else ""} and {FLOW_TOLERANCE * 100:g}% of the same flow merged into one
+
+"""
+
+    def execute(self, data):
+        settings = self.getSettings()
+        data[:] = merge_layers(settings, data, list(START_STATE))
+        data[0] = self.getPrintInfo(settings) + data[0]
+        return data
+
+    def getLineTransform(self, state=START_STATE):
+        """Returns (lines added before the GCode, function merging an iterable of lines, lines added after the GCode).
+        The function yields the output lines and can be called on one layer after another, the state is carried on (see GCodePipeline.py).
+        state is the state to start from, e.g. one of getLayerStates when starting part way through the GCode.
+        """
+        settings = self.getSettings()
+        state = list(state)
+        return self.getPrintInfo(settings).splitlines(keepends=True), lambda lines: merge_lines(settings, lines, state), []
+
+    def getStateKey(self):
+        """Returns a key for the settings the state carried from layer to layer depends on, which states from getLayerStates can be stored under."""
+        return "MergeSegments" # the position and modes don't depend on the settings
+
+    def getLayerStates(self, layers, state=START_STATE):
+        """Returns the state at the start of each of layers and after the last one, starting from state."""
+        settings = (0.0, 1, 0.0, False) # a window of one move, so only the state is followed
+        states = [tuple(state)]
+        for layer in layers:
+            state = list(states[-1])
+            for line in merge_lines(settings, layer.splitlines(keepends=True), state):
+                pass
+            states.append(tuple(state))
+        return states
+
+    def executeStream(self, lines):
+        """Same as execute, but takes an iterable of lines instead of layers and yields the output lines.
+        Only the moves being merged are held, so files of any size can be processed (see GCodeStream.py).
+        """
+        before, transform, after = self.getLineTransform()
+        yield from before
+        yield from transform(lines)
+        yield from after
+
+if __name__ == "__main__":
+    print("Running DEBUG program...")
+
+    script = MergeSegments()
+    script.KeyValue = {
+        "TOLERANCE": 0.01,
+        "WINDOW": 32,
+        "FLOW_TOLERANCE": 5,
+        "ARCS": True
+    }
+    script.DEBUG()
+
+    print("DEBUG program finished!")
@@ -0,0 +1,165 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared column representation of GCode used by the scripts in this folder.
+# A layer is parsed into a NumPy structured array with one row per line, so scripts can work on whole columns at once.
+# NumPy ships with Cura. Outside of Cura the scripts only use this module when NumPy is installed.
+# Copy this file into the same folder as the scripts that use it.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from GCodeTokenizer import splits_at_newlines
+
+COLUMNS = "XYZEFABCIJPS" # I J for arcs, P S for dwells and accelerations (see MoveTime.py)
+BIT = {letter: 1 << i for i, letter in enumerate(COLUMNS)}
+
+DTYPE = [("command", "U16")] + [(letter, "f8") for letter in COLUMNS] + [
+    ("mask", "u2"),    # bit BIT[letter] is set when the line has that word
+    ("words", "u2"),   # number of words before the comment, including the command
+    ("start", "i8"),   # offset of the start of the line in the text
+    ("comment", "i8"), # offset of the ";" starting the comment, or of the end of the line when there is none
+    ("end", "i8")      # offset of the start of the next line
+]
+
+# characters str.split() splits at that aren't in latin-1, so aren't SEPARATOR
+OTHER_SPACES = "\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u205f\u3000"
+
+WIDTH = 32 # longest word read, longer words are treated as having no value
+
+if np is not None:
+    # characters str.split() splits at (after encoding to latin-1), and the ";" starting comments
+    SEPARATOR = np.zeros(256, bool)
+    SEPARATOR[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32, 133, 160]] = True
+    SEPARATOR[59] = True # ";"
+    DIGIT = np.zeros(256, bool)
+    DIGIT[48:58] = True
+
+def available():
+    return np is not None
+
+def fits(text):
+    """True when the rows of text's table are the same lines, split into the same words, as splitlines and tokenize give."""
+    return splits_at_newlines(text) and (text.isascii() or not any(c in text for c in OTHER_SPACES))
+
+def first_of_each(ids):
+    """For sorted ids, returns (unique ids, index of the first occurrence of each)."""
+    first = np.flatnonzero(np.diff(ids, prepend=-1))
+    return ids[first], first
+
+def window(padded, starts, stops, width):
+    """Copies the characters from each start to stop (at most width) into the rows of a (len(starts), width) array, padded with 0."""
+    block = padded[starts[:, None] + np.arange(width)]
+    block[np.arange(width) >= (stops - starts)[:, None]] = 0
+    return block
+
+def parse(text, columns=COLUMNS):
+    """Parses text (one or more lines of GCode) into a move table with one row per line.
+    Only the letters in columns are read, the other columns are left NaN.
+    Each column holds the value of the first word of the line for that letter with a value (as find_word), or NaN if there is none or float() can't read it.
+    A column's bit in mask is set when it holds a value, and words is the number of words of the line (as tokenize splits its code).
+    command is the first word of the line (e.g. "G1") as tokenize returns it, or "" if it has none.
+    Lines are split at "\\n" only.
+    """
+    chars = np.frombuffer(text.encode("latin-1", "replace"), np.uint8) # one byte per character, so offsets match text
+    size = len(chars)
+
+    newlines = np.flatnonzero(chars == 10)
+    ends = newlines + 1
+    if size and chars[-1] != 10:
+        ends = np.append(ends, size)
+    count = len(ends)
+
+    table = np.zeros(count, DTYPE)
+    table["start"][1:] = ends[:-1]
+    table["end"] = ends
+    for letter in COLUMNS:
+        table[letter] = np.nan
+
+    # comment offset: first ";" of each line, otherwise the end of the line without its line break
+    line_ends = ends.copy()
+    line_ends[:len(newlines)] = newlines
+    comments = line_ends.copy()
+    semicolons = np.flatnonzero(chars == 59)
+    if len(semicolons):
+        lines, first = first_of_each(np.searchsorted(ends, semicolons, "right"))
+        comments[lines] = semicolons[first]
+    table["comment"] = comments
+
+    # words are runs of characters that aren't space or ";", the ones after the comment starts are dropped
+    edges = np.diff(SEPARATOR[chars].view(np.int8), prepend=np.int8(1), append=np.int8(1))
+    starts = np.flatnonzero(edges == -1)
+    stops = np.flatnonzero(edges == 1)
+    word_lines = np.searchsorted(ends, starts, "right")
+    code = starts < comments[word_lines]
+    if not code.all():
+        starts = starts[code]
+        stops = stops[code]
+        word_lines = word_lines[code]
+    if not len(starts):
+        return table
+    table["words"] = np.bincount(word_lines, minlength=count)
+    padded = np.concatenate((chars, np.zeros(WIDTH, np.uint8)))
+
+    lines, first = first_of_each(word_lines)
+    width = min(int((stops[first] - starts[first]).max()), 16)
+    table["command"][lines] = window(padded, starts[first], stops[first], width).astype(np.uint32).view("U{}".format(width)).ravel() # latin-1 characters are their code points
+
+    letters = chars[starts]
+    valued = stops - starts > 1
+    for letter in columns:
+        found = np.flatnonzero((letters == ord(letter)) & valued)
+        if not len(found):
+            continue
+        lines, first = first_of_each(word_lines[found])
+        found = found[first]
+
+        # most values are an optional sign, then digits with at most one ".", which are converted a column at a time
+        lengths = stops[found] - starts[found] - 1
+        width = min(int(lengths.max()), WIDTH)
+        block = window(padded, starts[found] + 1, stops[found], width)
+        inside = np.arange(width) < lengths[:, None]
+        digits = DIGIT[block] & inside
+        dots = (block == 46) & inside
+        allowed = digits | dots | ~inside
+        allowed[:, 0] |= (block[:, 0] == 43) | (block[:, 0] == 45)
+        number = allowed.all(1) & digits.any(1) & (dots.sum(1) <= 1) & (lengths <= WIDTH)
+
+        table[letter][lines[number]] = block[number].view("S{}".format(width)).ravel().astype(np.float64)
+        # the rest (e.g. "1.0e-3", or longer than WIDTH) are read one at a time with float(), as the scripts read each line
+        for i in np.flatnonzero(~number).tolist():
+            try:
+                table[letter][lines[i]] = float(text[starts[found[i]] + 1:stops[found[i]]])
+            except ValueError:
+                continue
+            number[i] = True
+        table["mask"][lines[number]] |= BIT[letter]
+    return table
+
+def has(table, letter):
+    """Boolean column, True for the lines with a word for letter."""
+    return (table["mask"] & BIT[letter]) != 0
+
+def line(text, table, row):
+    """Returns (code, comment) of a row, as tokenize would."""
+    return text[table["start"][row]:table["comment"][row]], text[table["comment"][row]:table["end"][row]]
+
+def contains(text, table, codes):
+    """Boolean column, True for the lines whose code (before the comment) contains any of codes.
+    Same as compile_codes(codes).search(code) on each line.
+    """
+    chars = np.frombuffer(text.encode("latin-1", "replace"), np.uint8)
+    found = np.zeros(len(table), bool)
+    for code in codes:
+        pattern = np.frombuffer(code.encode("latin-1", "replace"), np.uint8)
+        positions = len(chars) - len(pattern) + 1
+        if positions <= 0:
+            continue
+        at = chars[:positions] == pattern[0]
+        for i in range(1, len(pattern)):
+            at &= chars[i:positions + i] == pattern[i]
+        at = np.flatnonzero(at)
+        lines = np.searchsorted(table["end"], at, "right")
+        found[lines[at + len(pattern) <= table["comment"][lines]]] = True
+    return found
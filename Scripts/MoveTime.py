@@ -0,0 +1,214 @@
+# Copyright (c) 2022 Michael Joyce-Badea
+
+# Shared estimate of how long GCode takes to run, for the scripts in this folder and the tools in the Debug folder.
+# Each layer is parsed into a move table (see MoveTable.py) and the time of every line is worked out a column at a time:
+# the length of each move (G0/G1, and G2/G3 arcs with I and J) at its feed rate, with trapezoidal speed profiles when
+# an acceleration is set with M204 (limited by M201), and the dwells of G4 (P in milliseconds, or seconds on the dwells ExternalExtruder adds).
+# Speeds at the corners between moves are the lower of the two feed rates, scaled down by how sharply the direction changes,
+# and each text is taken to end at rest.
+# Homing (G28) and moves with no feed rate set are taken to be instant.
+# Copy this file into the same folder as the scripts that use it.
+
+import MoveTable
+
+np = MoveTable.np
+
+# (X, Y, Z, E, F, Absolute, E_Absolute, Acceleration, Acceleration_limit, Direction_X, Direction_Y, Direction_Z, Speed)
+# The position and modes at the start of the text, and the direction and speed (mm/s) of the last move, for the corner to the first move.
+# An acceleration or limit of 0 is none.
+START_STATE = (0.0, 0.0, 0.0, 0.0, 0.0, True, True, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+ROBOT_DWELL = ";Robot Dwell" # comment on the dwells ExternalExtruder adds, whose P is in seconds as the robots it writes them for read it
+
+BATCH = 4096 # lines a Clock estimates at a time
+
+def available():
+    return MoveTable.available()
+
+def carried(mask, values, start):
+    """values at the rows where mask is True, carried on to the rows after them, and start before the first."""
+    last = np.maximum.accumulate(np.where(mask, np.arange(len(mask)), -1))
+    return np.where(last >= 0, values[np.maximum(last, 0)], start)
+
+def profile_times(length, speed, entry, exit, acceleration):
+    """Time (s) of moves of length (mm) at speed (mm/s), from entry to exit speed, at acceleration (mm/s^2, 0 for none)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        constant = np.where(speed > 0, length / speed, 0.0)
+        entry = np.minimum(entry, speed)
+        exit = np.minimum(exit, speed)
+        accelerating = (speed * speed - entry * entry) / (2 * acceleration)
+        decelerating = (speed * speed - exit * exit) / (2 * acceleration)
+        cruising = length - accelerating - decelerating
+        trapezoid = (2 * speed - entry - exit) / acceleration + cruising / speed
+        # too short to reach speed: up to the peak speed and back down, or a ramp from entry to exit if even that can't be reached
+        peak = np.sqrt((2 * acceleration * length + entry * entry + exit * exit) / 2)
+        triangle = np.where(peak >= np.maximum(entry, exit), (2 * peak - entry - exit) / acceleration, 2 * length / (entry + exit))
+        times = np.where(cruising >= 0, trapezoid, triangle)
+    return np.where((acceleration > 0) & (speed > 0) & (length > 0), times, constant)
+
+def positions(table, state=START_STATE):
+    """Returns (positions, absolute, E_absolute) for the lines of a move table (see MoveTable.parse), starting from state.
+    positions is the columns [X, Y, Z, E] of the position after each line, and absolute[i] and E_absolute[i] whether line i's axes and E are absolute (G90/G91, M82/M83).
+    """
+    X, Y, Z, E, F, Absolute, E_Absolute = state[:7]
+    command = table["command"]
+    move = (command == "G0") | (command == "G1") | (command == "G2") | (command == "G3")
+    reset = command == "G92"
+    home = command == "G28"
+
+    # G90/G91 set the mode of every axis, M82/M83 that of E only
+    absolute = carried((command == "G90") | (command == "G91"), command == "G90", Absolute)
+    E_absolute = carried(np.isin(command, ("G90", "G91", "M82", "M83")), (command == "G90") | (command == "M82"), E_Absolute)
+
+    # position after each line: set where it is given absolutely, by G92 or by homing (all axes when G28 names none), and added up in between
+    axes = (table["mask"] & (MoveTable.BIT["X"] | MoveTable.BIT["Y"] | MoveTable.BIT["Z"])) != 0
+    columns = []
+    for letter, start, modes in (("X", X, absolute), ("Y", Y, absolute), ("Z", Z, absolute), ("E", E, E_absolute)):
+        values = np.nan_to_num(table[letter])
+        given = MoveTable.has(table, letter) & (move | reset)
+        homed = home & (MoveTable.has(table, letter) | ~axes) & (letter != "E")
+        absolute_set = (given & (modes | reset)) | homed
+        steps = np.cumsum(np.where(given & ~absolute_set, values, 0.0))
+        base = carried(absolute_set, np.where(homed, 0.0, values) - steps, start)
+        columns.append(base + steps)
+    return columns, absolute, E_absolute
+
+def estimate(text, state=START_STATE, table=None, distances=False):
+    """Estimates how long the lines of text (one or more layers of GCode) take to run, starting from state.
+    Returns (times, state after text), where times[i] is the time (s) from the start of text to the end of line i.
+    table is text's move table, if it has already been parsed (see MoveTable.parse) with the columns X Y Z E F I J P S.
+    With distances, returns (times, state after text, distances), where distances[i] is the length (mm) of the path of line i's move, 0 for moves of E only and other lines.
+    """
+    if table is None:
+        table = MoveTable.parse(text, "XYZEFIJPS")
+    X, Y, Z, E, F, Absolute, E_Absolute, Acceleration, Acceleration_limit, Direction_X, Direction_Y, Direction_Z, Speed = state
+    count = len(table)
+    if not count:
+        return (np.zeros(0), tuple(state)) + ((np.zeros(0),) if distances else ())
+    command = table["command"]
+    linear = (command == "G0") | (command == "G1")
+    arc = (command == "G2") | (command == "G3")
+    move = linear | arc
+    home = command == "G28"
+
+    after, absolute, E_absolute = positions(table, state)
+    Absolute = bool(absolute[-1])
+    E_Absolute = bool(E_absolute[-1])
+    X_after, Y_after, Z_after, E_after = after
+    X_before, Y_before, Z_before, E_before = (np.concatenate(([start], column[:-1])) for start, column in zip((X, Y, Z, E), after))
+
+    dX = np.where(move, X_after - X_before, 0.0)
+    dY = np.where(move, Y_after - Y_before, 0.0)
+    dZ = np.where(move, Z_after - Z_before, 0.0)
+    length = np.sqrt(dX * dX + dY * dY + dZ * dZ)
+    if arc.any():
+        # the arc around the centre at I J from the start, clockwise for G2, with any Z move as a helix
+        I = np.nan_to_num(table["I"])
+        J = np.nan_to_num(table["J"])
+        start_angle = np.arctan2(-J, -I)
+        end_angle = np.arctan2(Y_after - (Y_before + J), X_after - (X_before + I))
+        sweep = np.where(command == "G2", start_angle - end_angle, end_angle - start_angle) % (2 * np.pi)
+        sweep = np.where(sweep == 0, 2 * np.pi, sweep)
+        length = np.where(arc, np.hypot(np.hypot(I, J) * sweep, dZ), length)
+    path = length
+    # moves of E only take as long as the E move
+    extruding = move & (length == 0)
+    length = np.where(extruding, np.abs(np.where(move, E_after - E_before, 0.0)), length)
+
+    feed = carried(MoveTable.has(table, "F") & move, table["F"], F) / 60
+    F = float(feed[-1] * 60)
+    M204 = command == "M204"
+    acceleration = carried(M204 & (MoveTable.has(table, "P") | MoveTable.has(table, "S")), np.where(MoveTable.has(table, "P"), table["P"], table["S"]), Acceleration)
+    M201 = (command == "M201") & (MoveTable.has(table, "X") | MoveTable.has(table, "Y"))
+    limit = carried(M201, np.fmin(table["X"], table["Y"]), Acceleration_limit)
+    Acceleration = float(acceleration[-1])
+    Acceleration_limit = float(limit[-1])
+    acceleration = np.where((limit > 0) & ((acceleration == 0) | (limit < acceleration)), limit, acceleration)
+
+    # the speed at the corner before each move, from the move before it (G4 and homing stop in between)
+    dwell = command == "G4"
+    stops = np.cumsum(dwell | home)
+    rows = np.flatnonzero(move & (length > 0))
+    times = np.zeros(count)
+    if len(rows):
+        # moves of E only have no direction, so stop at both ends
+        directions = np.stack((dX[rows], dY[rows], dZ[rows])) / np.where(extruding[rows], np.inf, length[rows])
+        speeds = feed[rows]
+        previous = np.concatenate(([[Direction_X], [Direction_Y], [Direction_Z]], directions[:, :-1]), axis=1)
+        corners = np.minimum(np.concatenate(([Speed], speeds[:-1])), speeds) * np.clip((previous * directions).sum(0), 0, 1)
+        corners[np.diff(stops[rows], prepend=0) > 0] = 0.0
+        times[rows] = profile_times(length[rows], speeds, corners, np.append(corners[1:], 0.0), acceleration[rows])
+        Direction_X, Direction_Y, Direction_Z = directions[:, -1].tolist()
+        Speed = 0.0 if stops[-1] > stops[rows[-1]] else float(speeds[-1])
+    elif stops[-1]:
+        Speed = 0.0
+
+    # G4 waits P milliseconds (seconds on a Robot Dwell) or S seconds
+    P = dwell & MoveTable.has(table, "P")
+    P_unit = np.full(count, 0.001)
+    for row in np.flatnonzero(P).tolist():
+        if text.startswith(ROBOT_DWELL, int(table["comment"][row])):
+            P_unit[row] = 1.0
+    times[dwell] = np.where(P[dwell], table["P"][dwell] * P_unit[dwell], np.nan_to_num(table["S"][dwell]))
+
+    state = (float(X_after[-1]), float(Y_after[-1]), float(Z_after[-1]), float(E_after[-1]), F, Absolute, E_Absolute,
+             Acceleration, Acceleration_limit, Direction_X, Direction_Y, Direction_Z, Speed)
+    if distances:
+        return np.cumsum(times), state, path
+    return np.cumsum(times), state
+
+class Clock:
+    """Times GCode a line at a time, for scripts that work line by line. The lines are estimated BATCH at a time (see estimate), from state,
+    which is brought up to the end of the lines yielded so far a batch at a time.
+    """
+
+    def __init__(self, state=START_STATE, moves=False, breaks=()):
+        """With moves, the path of each line is kept as well as its time (see lines).
+        A new batch is started at each line starting with one of breaks, e.g. where Cura starts each layer it passes to the scripts, as each batch is taken to end at rest.
+        """
+        self.state = tuple(state)
+        self.moves = moves
+        self.breaks = tuple(breaks)
+        self.seconds = 0.0
+        self.distance = 0.0
+        self.move = None
+
+    def lines(self, lines):
+        """Yields each of lines (with their line endings), with seconds set to how long (s) it takes.
+        With moves, distance is also set to the length (mm) of its path (see estimate), and move to (start, end, Absolute, E_Absolute)
+        for a G0/G1 that moves, where start and end are its [X, Y, Z, E] and the others its modes (G90/G91, M82/M83), and to None otherwise.
+        Items that aren't strings (e.g. ExternalExtruder's LeadGCode) are passed through and take no time. Reads up to BATCH lines ahead.
+        """
+        batch = []
+        for line in lines:
+            if len(batch) >= BATCH or (batch and type(line) is str and line.startswith(self.breaks)):
+                yield from self.batch(batch)
+                batch = []
+            batch.append(line)
+        yield from self.batch(batch)
+
+    def batch(self, batch):
+        timed = iter(self.time([line for line in batch if type(line) is str]))
+        for line in batch:
+            self.seconds, self.distance, self.move = next(timed) if type(line) is str else (0.0, 0.0, None)
+            yield line
+
+    def time(self, lines):
+        """Returns (seconds, distance, move) for each of lines (see lines), and brings state up to the end of them."""
+        if not lines:
+            return []
+        text = "".join(lines)
+        table = MoveTable.parse(text, "XYZEFIJPS")
+        if len(table) != len(lines): # lines ending in a line break other than "\n" run on into the next row of the table, so are timed one at a time
+            return [timed for line in lines for timed in self.time([line])] if len(lines) > 1 else [(0.0, 0.0, None)]
+        start = self.state
+        times, self.state, distances = estimate(text, start, table, True)
+        seconds = np.diff(times, prepend=0.0).tolist()
+        moves = [None] * len(lines)
+        if self.moves:
+            after, absolute, E_absolute = positions(table, start)
+            before = [np.concatenate(([start[i]], column[:-1])) for i, column in enumerate(after)]
+            command = table["command"]
+            for row in np.flatnonzero(((command == "G0") | (command == "G1")) & (distances > 0)).tolist():
+                moves[row] = ([float(column[row]) for column in before], [float(column[row]) for column in after], bool(absolute[row]), bool(E_absolute[row]))
+        return list(zip(seconds, distances.tolist(), moves))